@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20250110_0003"
+down_revision = "20241230_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Expression index backing ClipVersionRepository.get_versions_by_quality_threshold.
+    op.create_index(
+        "ix_clip_versions_overall_score",
+        "clip_versions",
+        [sa.text("json_extract(quality_metrics, '$.overall_score')")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clip_versions_overall_score", table_name="clip_versions")
@@ -4,6 +4,7 @@ import logging
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -80,7 +81,10 @@ async def upload_asset(
     storage_service = StorageService(settings, asset_repo)
     
     try:
-        asset = storage_service.ingest_media_asset(
+        # Spooling, hashing and publishing the upload is blocking file I/O; keep it
+        # off the event loop so concurrent requests are still served.
+        asset = await run_in_threadpool(
+            storage_service.ingest_media_asset,
             project_id=project_id,
             asset_type=asset_type,
             fileobj=file.file,
@@ -128,7 +132,8 @@ async def upload_asset(
     
     if asset_type == MediaAssetType.SOURCE:
         try:
-            job = ProcessingJobLifecycle.enqueue(
+            job = await run_in_threadpool(
+                ProcessingJobLifecycle.enqueue,
                 job_type=ProcessingJobType.INGEST,
                 payload={
                     "asset_id": asset.id,
@@ -207,7 +212,7 @@ async def list_assets(
     assets = result.scalars().all()
     
     return PaginatedResponse[MediaAssetRead](
-        items=[MediaAssetRead.model_validate(asset) for asset in assets],
+        items=[MediaAssetRead.from_trusted(asset) for asset in assets],
         total=total,
         offset=offset,
         limit=limit,
@@ -56,7 +56,7 @@ async def list_clips(
     clips = result.scalars().all()
     
     return PaginatedResponse[ClipRead](
-        items=[ClipRead.model_validate(clip) for clip in clips],
+        items=[ClipRead.from_trusted(clip) for clip in clips],
         total=total,
         offset=offset,
         limit=limit,
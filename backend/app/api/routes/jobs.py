@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
@@ -39,7 +40,9 @@ async def create_and_enqueue_job(
         HTTPException: If job enqueueing fails due to queue connection issues
     """
     try:
-        job = ProcessingJobLifecycle.enqueue(
+        # Enqueueing does blocking DB and broker I/O; keep it off the event loop.
+        job = await run_in_threadpool(
+            ProcessingJobLifecycle.enqueue,
             job_type=job_type,
             payload=payload,
             clip_version_id=clip_version_id,
@@ -70,7 +73,7 @@ async def get_job_status(job_id: str) -> ProcessingJobRead:
     Raises:
         HTTPException: If job is not found
     """
-    job = ProcessingJobLifecycle.get_job(job_id)
+    job = await run_in_threadpool(ProcessingJobLifecycle.get_job, job_id)
     
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
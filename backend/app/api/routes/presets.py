@@ -57,7 +57,7 @@ async def list_presets(
     presets = result.scalars().all()
     
     return PaginatedResponse[PresetRead](
-        items=[PresetRead.model_validate(preset) for preset in presets],
+        items=[PresetRead.from_trusted(preset) for preset in presets],
         total=total,
         offset=offset,
         limit=limit,
@@ -78,7 +78,7 @@ async def list_projects(
     projects = result.scalars().all()
     
     return PaginatedResponse[ProjectRead](
-        items=[ProjectRead.model_validate(project) for project in projects],
+        items=[ProjectRead.from_trusted(project) for project in projects],
         total=total,
         offset=offset,
         limit=limit,
@@ -68,6 +68,9 @@ class Settings(BaseSettings):
     gpu_enabled: bool = Field(default=False)
     gpu_device: str = Field(default="cuda:0")
 
+    # Media analysis; 0 leaves the thread count to ffmpeg
+    ffmpeg_analysis_threads: int = Field(default=2, ge=0)
+
     @computed_field
     @property
     def project_root(self) -> Path:
@@ -3,7 +3,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import AsyncGenerator, Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
@@ -20,13 +20,28 @@ def _get_connect_args(database_url: str) -> dict[str, object]:
 settings: Settings = get_settings()
 
 
+def _apply_sqlite_pragmas(dbapi_connection: object, _connection_record: object) -> None:
+    # WAL lets readers proceed during writes, and NORMAL sync is durable under WAL
+    # while skipping an fsync per commit.
+    cursor = dbapi_connection.cursor()  # type: ignore[attr-defined]
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 def _create_engine(url: str) -> Engine:
     connect_args = _get_connect_args(url)
-    return create_engine(url, connect_args=connect_args, future=True)
+    created = create_engine(url, connect_args=connect_args, future=True)
+    if url.startswith("sqlite"):
+        event.listen(created, "connect", _apply_sqlite_pragmas)
+    return created
 
 
 def _create_async_engine(url: str) -> AsyncEngine:
-    return create_async_engine(url, future=True)
+    created = create_async_engine(url, future=True)
+    if url.startswith("sqlite"):
+        event.listen(created.sync_engine, "connect", _apply_sqlite_pragmas)
+    return created
 
 
 engine: Engine = _create_engine(settings.database_url)
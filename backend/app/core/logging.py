@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import logging.config
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 from .config import Settings
@@ -18,7 +18,7 @@ class JsonLogFormatter(logging.Formatter):
 
     def _build_record(self, record: logging.LogRecord) -> Dict[str, Any]:
         data: Dict[str, Any] = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace("+00:00", "Z"),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import JSON, Enum as SQLEnum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Enum as SQLEnum, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, IDMixin, TimestampMixin
@@ -37,6 +37,13 @@ class Clip(IDMixin, TimestampMixin, Base):
 
 class ClipVersion(IDMixin, TimestampMixin, Base):
     __tablename__ = "clip_versions"
+    # Mirrors migration 20250110_0003 so schemas built with create_all carry the index too.
+    __table_args__ = (
+        Index(
+            "ix_clip_versions_overall_score",
+            text("json_extract(quality_metrics, '$.overall_score')"),
+        ),
+    )
 
     clip_id: Mapped[str] = mapped_column(ForeignKey("clips.id", ondelete="CASCADE"), nullable=False)
     output_asset_id: Mapped[Optional[str]] = mapped_column(
@@ -25,6 +25,15 @@ class SQLAlchemyRepository(Generic[ModelType]):
     def get(self, entity_id: str) -> Optional[ModelType]:
         return self.session.get(self.model_cls, entity_id)
 
+    def get_many(self, entity_ids: Iterable[str]) -> Dict[str, ModelType]:
+        """Fetch several entities in one query, keyed by id; missing ids are omitted."""
+
+        ids = set(entity_ids)
+        if not ids:
+            return {}
+        stmt = select(self.model_cls).where(self.model_cls.id.in_(ids))
+        return {instance.id: instance for instance in self.session.execute(stmt).scalars()}
+
     def list(self, *, offset: int = 0, limit: int = 100) -> Iterable[ModelType]:
         stmt = select(self.model_cls).offset(offset).limit(limit)
         return self.session.execute(stmt).scalars().all()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Sequence, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .base import SQLAlchemyRepository
 from ..models.clip import Clip, ClipVersion
@@ -20,19 +23,46 @@ class ClipVersionRepository(SQLAlchemyRepository[ClipVersion]):
         self.session.refresh(version)
         return version
 
+    def update_quality_metrics_many(self, updates: Iterable[Tuple[ClipVersion, Dict[str, Any]]]) -> int:
+        """Apply metrics to several versions in one flush and commit; instances are not refreshed."""
+
+        count = 0
+        for version, metrics in updates:
+            version.quality_metrics = metrics
+            self.session.add(version)
+            count += 1
+        if count:
+            self.session.commit()
+        return count
+
+    def prefetch_ranking_fields(self, versions: Sequence[ClipVersion]) -> None:
+        """Load the clips of ``versions`` in one query so ranking does not lazy-load them one at a time."""
+
+        pending = [version for version in versions if "clip" in inspect(version).unloaded]
+        if not pending:
+            return
+        clips = ClipRepository(self.session).get_many(version.clip_id for version in pending)
+        for version in pending:
+            clip = clips.get(version.clip_id)
+            if clip is not None:
+                set_committed_value(version, "clip", clip)
+
     def get_versions_by_quality_threshold(
         self, project_id: str, threshold: float, *, limit: int = 100
     ) -> list[ClipVersion]:
-        from sqlalchemy import and_, func
+        from sqlalchemy import and_, func, literal_column
         from ..models.clip import Clip
 
+        # The JSON path is rendered inline so SQLite can match the
+        # ix_clip_versions_overall_score expression index; a bound path cannot.
+        overall_score = func.json_extract(ClipVersion.quality_metrics, literal_column("'$.overall_score'"))
         query = (
             self.session.query(ClipVersion)
             .join(Clip)
             .filter(
                 and_(
                     Clip.project_id == project_id,
-                    func.json_extract(ClipVersion.quality_metrics, "$.overall_score") >= threshold,
+                    overall_score >= threshold,
                 )
             )
             .limit(limit)
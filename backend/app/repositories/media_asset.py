@@ -18,11 +18,12 @@ class MediaAssetRepository(SQLAlchemyRepository[MediaAsset]):
         checksum: str | None | object = _UNSET,
     ) -> MediaAsset:
         payload: dict[str, object] = {}
-        if size_bytes is not _UNSET:
+        # Only changed values are written; an unchanged probe result costs no commit/refresh round-trip.
+        if size_bytes is not _UNSET and size_bytes != instance.size_bytes:
             payload["size_bytes"] = size_bytes
-        if duration_seconds is not _UNSET:
+        if duration_seconds is not _UNSET and duration_seconds != instance.duration_seconds:
             payload["duration_seconds"] = duration_seconds
-        if checksum is not _UNSET:
+        if checksum is not _UNSET and checksum != instance.checksum:
             payload["checksum"] = checksum
         if not payload:
             return instance
@@ -39,6 +40,8 @@ class MediaAssetRepository(SQLAlchemyRepository[MediaAsset]):
         return self.update(instance, payload)
 
     def clear_analysis_cache(self, instance: MediaAsset) -> MediaAsset:
+        if instance.analysis_cache is None:
+            return instance
         return self.update(instance, {"analysis_cache": None})
 
 
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+ORMModelT = TypeVar("ORMModelT", bound="ORMModel")
+
 
 class ORMModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_trusted(cls: type[ORMModelT], obj: Any) -> ORMModelT:
+        """Build from a persisted ORM row, skipping validation of data the database already constrains."""
+
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
 
 class TimestampedSchema(ORMModel):
     id: str
@@ -42,6 +42,10 @@ PROMPT_TEMPLATE = (
     "Scene Breakdowns:\n{scenes}\n"
 )
 
+_PROMPT_CACHE_SIZE = 32
+_format_transcript_line = "{}. {:.2f}s–{:.2f}s | {}{}".format
+_format_scene_line = "{}. Scene {} [{:.2f}-{:.2f}s] ({}, {}, {}) -> {}".format
+
 
 @dataclass(frozen=True)
 class SceneScoringWeights:
@@ -170,6 +174,11 @@ class AnalysisService:
         self._repository = repository
         self._weights = weights or SceneScoringWeights()
         self._logger = logger or logging.getLogger("backend.app.services.ai.analysis")
+        self._prompt_cache: dict[str, str] = {}
+        # Weights are frozen, so their slice of every cache key is serialised once.
+        self._weights_key_suffix = (
+            ',"weights":' + json.dumps(asdict(self._weights), sort_keys=True, separators=(",", ":")) + "}"
+        ).encode("utf-8")
 
     def analyse_media_asset(
         self,
@@ -189,7 +198,7 @@ class AnalysisService:
                 self._logger.debug("Returning cached analysis", extra={"extra": {"asset_id": asset.id}})
                 return cached
 
-        prompt = self._build_prompt(validated_segments, validated_scenes)
+        prompt = self._get_prompt(cache_key, validated_segments, validated_scenes)
 
         try:
             response = self._router.generate_text(prompt=prompt)
@@ -211,12 +220,16 @@ class AnalysisService:
         scene_lookup = {scene.scene_id: scene for scene in validated_scenes}
         score_lookup = {score.scene_id: score for score in scene_scores}
         key_moments = self._build_key_moments(payload.moments, scene_lookup, score_lookup)
+        # Everything below comes from validated provider payloads or computed scores,
+        # so the result models are assembled without a second validation pass.
         entities = [
-            EntityInfo(name=entity.name, type=entity.type, mentions=entity.mentions, salience=entity.salience)
+            EntityInfo.model_construct(
+                name=entity.name, type=entity.type, mentions=entity.mentions, salience=entity.salience
+            )
             for entity in payload.entities
         ]
 
-        result = VideoAnalysisResult(
+        result = VideoAnalysisResult.model_construct(
             topics=payload.topics,
             summary=payload.summary,
             entities=entities,
@@ -237,7 +250,12 @@ class AnalysisService:
         ]
 
     def _normalise_scenes(self, scenes: Sequence[SceneInput | Mapping[str, Any]]) -> list[SceneInput]:
-        return [scene if isinstance(scene, SceneInput) else SceneInput.model_validate(scene) for scene in scenes]
+        # Scenes are ordered once here; prompt formatting and scoring rely on it.
+        validated = [
+            scene if isinstance(scene, SceneInput) else SceneInput.model_validate(scene) for scene in scenes
+        ]
+        validated.sort(key=lambda scene: scene.start)
+        return validated
 
     def _load_from_cache(self, asset: MediaAsset, cache_key: str) -> VideoAnalysisResult | None:
         cache = asset.analysis_cache
@@ -258,37 +276,65 @@ class AnalysisService:
             return None
         return cached
 
+    def _get_prompt(
+        self,
+        cache_key: str,
+        segments: Sequence[TranscriptSegment],
+        scenes: Sequence[SceneInput],
+    ) -> str:
+        # The cache key already fingerprints the prompt inputs, so retries after a
+        # provider failure reuse the rendered prompt instead of formatting it again.
+        prompt = self._prompt_cache.get(cache_key)
+        if prompt is None:
+            prompt = self._build_prompt(segments, scenes)
+            if len(self._prompt_cache) >= _PROMPT_CACHE_SIZE:
+                self._prompt_cache.pop(next(iter(self._prompt_cache)))
+            self._prompt_cache[cache_key] = prompt
+        return prompt
+
     def _build_prompt(self, segments: Sequence[TranscriptSegment], scenes: Sequence[SceneInput]) -> str:
         transcript_block = self._format_transcript(segments)
         scenes_block = self._format_scenes(scenes)
         return PROMPT_TEMPLATE.format(transcript=transcript_block, scenes=scenes_block)
 
     def _format_transcript(self, segments: Sequence[TranscriptSegment]) -> str:
-        lines: list[str] = []
-        for index, segment in enumerate(segments, start=1):
-            speaker = f"{segment.speaker}: " if segment.speaker else ""
-            lines.append(
-                f"{index}. {segment.start:.2f}s–{segment.end:.2f}s | {speaker}{segment.text.strip()}"
+        if not segments:
+            return "(no transcript segments)"
+        return "\n".join(
+            _format_transcript_line(
+                index,
+                segment.start,
+                segment.end,
+                f"{segment.speaker}: " if segment.speaker else "",
+                segment.text.strip(),
             )
-        return "\n".join(lines) if lines else "(no transcript segments)"
+            for index, segment in enumerate(segments, start=1)
+        )
 
     def _format_scenes(self, scenes: Sequence[SceneInput]) -> str:
-        lines: list[str] = []
-        for index, scene in enumerate(scenes, start=1):
-            sentiment = (
-                f"sentiment={scene.sentiment:+.2f}" if scene.sentiment is not None else "sentiment=neutral"
-            )
-            visual = (
-                f"visual={scene.visual_intensity:.2f}" if scene.visual_intensity is not None else "visual=neutral"
+        if not scenes:
+            return "(no scene data)"
+        return "\n".join(
+            _format_scene_line(
+                index,
+                scene.scene_id,
+                scene.start,
+                scene.end,
+                f"sentiment={scene.sentiment:+.2f}" if scene.sentiment is not None else "sentiment=neutral",
+                f"visual={scene.visual_intensity:.2f}" if scene.visual_intensity is not None else "visual=neutral",
+                f"tags={', '.join(scene.tags)}" if scene.tags else "tags=none",
+                self._scene_excerpt(scene.transcript),
             )
-            tags = f"tags={', '.join(scene.tags)}" if scene.tags else "tags=none"
-            transcript_excerpt = scene.transcript.replace("\n", " ").strip()
-            if len(transcript_excerpt) > 160:
-                transcript_excerpt = transcript_excerpt[:157] + "..."
-            lines.append(
-                f"{index}. Scene {scene.scene_id} [{scene.start:.2f}-{scene.end:.2f}s] ({sentiment}, {visual}, {tags}) -> {transcript_excerpt}"
-            )
-        return "\n".join(lines) if lines else "(no scene data)"
+            for index, scene in enumerate(scenes, start=1)
+        )
+
+    @staticmethod
+    def _scene_excerpt(transcript: str) -> str:
+        # Trim before replacing so long scene transcripts are only scanned up to the excerpt length.
+        excerpt = transcript.strip()
+        if len(excerpt) > 160:
+            return excerpt[:157].replace("\n", " ") + "..."
+        return excerpt.replace("\n", " ")
 
     def _parse_provider_payload(self, content: str) -> ProviderAnalysisPayload:
         payload_text = self._strip_code_fence(content.strip())
@@ -328,18 +374,26 @@ class AnalysisService:
 
     def _compute_scene_scores(self, scenes: Sequence[SceneInput], topics: Sequence[str]) -> list[SceneScore]:
         semantic_weight, sentiment_weight, visual_weight = self._weights.normalised()
+        topics_lower = [topic.lower() for topic in topics]
+        # Bound once; this loop runs for every scene of every analysed asset.
+        semantic_of = self._semantic_score
+        sentiment_of = self._normalise_sentiment
+        visual_of = self._normalise_visual
+        construct = SceneScore.model_construct
         scores: list[SceneScore] = []
+        append = scores.append
         for scene in scenes:
-            semantic_score = self._semantic_score(scene, topics)
-            sentiment_score = self._normalise_sentiment(scene.sentiment)
-            visual_score = self._normalise_visual(scene.visual_intensity)
+            semantic_score = semantic_of(scene, topics_lower)
+            sentiment_score = sentiment_of(scene.sentiment)
+            visual_score = visual_of(scene.visual_intensity)
             highlight = (
                 semantic_score * semantic_weight
                 + sentiment_score * sentiment_weight
                 + visual_score * visual_weight
             )
-            scores.append(
-                SceneScore(
+            # Inputs are already-validated SceneInput fields and computed floats.
+            append(
+                construct(
                     scene_id=scene.scene_id,
                     start=scene.start,
                     end=scene.end,
@@ -349,20 +403,18 @@ class AnalysisService:
                     highlight_score=highlight,
                 )
             )
-        scores.sort(key=lambda s: s.start)
         return scores
 
-    def _semantic_score(self, scene: SceneInput, topics: Sequence[str]) -> float:
-        if not topics:
+    def _semantic_score(self, scene: SceneInput, topics_lower: Sequence[str]) -> float:
+        if not topics_lower:
             return 0.0
         transcript_lower = scene.transcript.lower()
         tags_lower = [tag.lower() for tag in scene.tags]
         matches = 0
-        for topic in topics:
-            topic_lower = topic.lower()
+        for topic_lower in topics_lower:
             if topic_lower in transcript_lower or any(topic_lower in tag for tag in tags_lower):
                 matches += 1
-        return min(1.0, matches / max(len(topics), 1))
+        return min(1.0, matches / max(len(topics_lower), 1))
 
     def _normalise_sentiment(self, sentiment: float | None) -> float:
         if sentiment is None:
@@ -388,7 +440,7 @@ class AnalysisService:
             if scene is None or score is None:
                 continue
             compiled.append(
-                KeyMoment(
+                KeyMoment.model_construct(
                     scene_id=scene.scene_id,
                     start=scene.start,
                     end=scene.end,
@@ -401,7 +453,7 @@ class AnalysisService:
             top_scene = max(score_lookup.values(), key=lambda s: s.highlight_score)
             scene = scene_lookup[top_scene.scene_id]
             compiled.append(
-                KeyMoment(
+                KeyMoment.model_construct(
                     scene_id=scene.scene_id,
                     start=scene.start,
                     end=scene.end,
@@ -428,13 +480,20 @@ class AnalysisService:
         segments: Sequence[TranscriptSegment],
         scenes: Sequence[SceneInput],
     ) -> str:
-        payload = {
-            "transcript": [segment.model_dump() for segment in segments],
-            "scenes": [scene.model_dump() for scene in scenes],
-            "weights": asdict(self._weights),
-        }
-        serialised = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+        # Hashes the same bytes as json.dumps({"scenes", "transcript", "weights"}, sort_keys=True)
+        # without building the combined document.
+        digest = hashlib.blake2b(b'{"scenes":', digest_size=16)
+        digest.update(
+            json.dumps([scene.model_dump() for scene in scenes], sort_keys=True, separators=(",", ":")).encode("utf-8")
+        )
+        digest.update(b',"transcript":')
+        digest.update(
+            json.dumps(
+                [segment.model_dump() for segment in segments], sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+        )
+        digest.update(self._weights_key_suffix)
+        return digest.hexdigest()
 
 
 __all__ = [
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import math
+import random
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
+from email.utils import parsedate_to_datetime
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 from backend.app.core.config import Settings
@@ -26,6 +28,10 @@ class ProviderUsage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_USAGE_FIELDS = tuple(item.name for item in fields(ProviderUsage))
+_EMPTY_USAGE_VALUES = (None, {}, [], ())
+
+
 @dataclass(slots=True)
 class ProviderResponse:
     """Normalised response for AI generation calls."""
@@ -82,13 +88,22 @@ class ProviderNotConfiguredError(ProviderError):
 class ProviderRateLimitError(ProviderError):
     """Raised when a provider reports rate limiting."""
 
-    def __init__(self, provider: str, message: str, *, code: Optional[str] = None, status_code: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        provider: str,
+        message: str,
+        *,
+        code: Optional[str] = None,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
         super().__init__(
             provider,
             message,
             code=code or "rate_limit_exceeded",
             status_code=status_code,
             retryable=True,
+            extra={"retry_after": retry_after} if retry_after is not None else None,
         )
 
 
@@ -169,8 +184,7 @@ class BaseAIProvider(ABC):
             raise ProviderNotConfiguredError(self.name)
         normalised_messages = self._normalise_messages(prompt=prompt, messages=messages)
         operation = "generate_text"
-        call_options = dict(kwargs)
-        return self._execute_with_retry(operation, self._generate_text_impl, normalised_messages, call_options)
+        return self._execute_with_retry(operation, self._generate_text_impl, normalised_messages, kwargs)
 
     def generate_embedding(self, *, text: Sequence[str] | str, **kwargs: Any) -> ProviderResponse:
         if not self.is_enabled:
@@ -178,8 +192,7 @@ class BaseAIProvider(ABC):
         if not self.supports_embeddings:
             raise ProviderFeatureNotSupportedError(self.name, "embeddings")
         operation = "generate_embedding"
-        call_options = dict(kwargs)
-        return self._execute_with_retry(operation, self._generate_embedding_impl, text, call_options)
+        return self._execute_with_retry(operation, self._generate_embedding_impl, text, kwargs)
 
     def transcribe(self, *, audio_path: str, **kwargs: Any) -> ProviderResponse:
         if not self.is_enabled:
@@ -187,8 +200,7 @@ class BaseAIProvider(ABC):
         if not self.supports_transcription:
             raise ProviderFeatureNotSupportedError(self.name, "transcription")
         operation = "transcribe"
-        call_options = dict(kwargs)
-        return self._execute_with_retry(operation, self._transcribe_impl, audio_path, call_options)
+        return self._execute_with_retry(operation, self._transcribe_impl, audio_path, kwargs)
 
     # ------------------------------------------------------------------
     # Hooks for subclasses
@@ -232,10 +244,12 @@ class BaseAIProvider(ABC):
         attempt = 0
         while True:
             try:
-                cloned_args = [self._clone_for_retry(arg) for arg in args]
-                cloned_kwargs = {key: self._clone_for_retry(value) for key, value in kwargs.items()}
+                # Every attempt gets its own copies, so a provider that mutates its inputs never
+                # reaches the caller's objects, whatever the attempt number.
+                call_args = tuple(self._clone_for_retry(arg) for arg in args)
+                call_kwargs = {key: self._clone_for_retry(value) for key, value in kwargs.items()}
                 start = time.perf_counter()
-                result = self._execute_with_timeout(func, *cloned_args, **cloned_kwargs)
+                result = self._execute_with_timeout(func, *call_args, **call_kwargs)
                 duration = (time.perf_counter() - start) * 1000
                 self._record_usage(operation, result.usage, latency_ms=duration)
                 return result
@@ -243,7 +257,7 @@ class BaseAIProvider(ABC):
                 self._log_failure(operation, exc, attempt)
                 if attempt >= self.max_retries or not exc.info.retryable:
                     raise exc
-                sleep_time = self._compute_backoff(attempt)
+                sleep_time = self._compute_backoff(attempt, retry_after=exc.info.extra.get("retry_after"))
                 if sleep_time:
                     time.sleep(sleep_time)
                 attempt += 1
@@ -285,8 +299,12 @@ class BaseAIProvider(ABC):
 
     def _record_usage(self, operation: str, usage: ProviderUsage, *, latency_ms: float) -> None:
         usage.latency_ms = latency_ms
-        payload = asdict(usage)
-        payload = {key: value for key, value in payload.items() if value not in (None, {}, [], ())}
+        payload: Dict[str, Any] = {}
+        for key in _USAGE_FIELDS:
+            value = getattr(usage, key)
+            if value in _EMPTY_USAGE_VALUES:
+                continue
+            payload[key] = dict(value) if isinstance(value, dict) else value
         self.logger.info(
             "Provider call succeeded",
             extra={
@@ -311,12 +329,44 @@ class BaseAIProvider(ABC):
             },
         )
 
-    def _compute_backoff(self, attempt: int) -> float:
+    def _compute_backoff(self, attempt: int, *, retry_after: Optional[float] = None) -> float:
         if self.backoff_base <= 0:
             return 0.0
         delay = self.backoff_base * math.pow(self.backoff_factor, max(attempt, 0))
+        # Jitter spreads out retries from concurrent workers that were throttled together.
+        delay *= random.uniform(0.5, 1.5)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
         return min(delay, self.timeout if self.timeout > 0 else delay)
 
+    @staticmethod
+    def _extract_retry_after(exc: Exception) -> Optional[float]:
+        """Read the server's Retry-After hint (seconds) from an SDK exception, if present."""
+
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if not headers:
+            return None
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return max(float(retry_after_ms) / 1000.0, 0.0)
+            except (TypeError, ValueError):
+                pass
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
     def _clone_for_retry(self, value: Any) -> Any:
         if isinstance(value, dict):
             return {key: self._clone_for_retry(val) for key, val in value.items()}
@@ -140,7 +140,13 @@ class GeminiProvider(BaseAIProvider):
         message = getattr(exc, "message", None) or str(exc) or "Gemini request failed."
         lower_message = message.lower()
         if status_code == 429 or "resource exhausted" in lower_message or "rate limit" in lower_message:
-            return ProviderRateLimitError(self.name, message, code=str(status or "rate_limit"), status_code=status_code)
+            return ProviderRateLimitError(
+                self.name,
+                message,
+                code=str(status or "rate_limit"),
+                status_code=status_code,
+                retry_after=self._extract_retry_after(exc),
+            )
         retryable_status = {408, 409, 425, 500, 502, 503, 504}
         retryable = status_code in retryable_status if status_code is not None else "temporarily" in lower_message
         return ProviderError(self.name, message, code=str(status) if status else None, status_code=status_code, retryable=retryable)
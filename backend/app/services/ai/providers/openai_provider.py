@@ -127,7 +127,9 @@ class OpenAIProvider(BaseAIProvider):
         message = getattr(exc, "message", None) or str(exc) or "OpenAI request failed."
         lower_message = message.lower()
         if status == 429 or "rate limit" in lower_message:
-            return ProviderRateLimitError(self.name, message, code=code, status_code=status)
+            return ProviderRateLimitError(
+                self.name, message, code=code, status_code=status, retry_after=self._extract_retry_after(exc)
+            )
         retryable_status = {408, 409, 425, 429, 500, 502, 503, 504}
         retryable = status in retryable_status if status is not None else "temporarily" in lower_message
         return ProviderError(self.name, message, code=code, status_code=status, retryable=retryable)
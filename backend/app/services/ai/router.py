@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from backend.app.core.config import Settings
@@ -32,6 +33,9 @@ class AIProviderRouter:
         self.backoff_base = getattr(settings, "ai_provider_retry_base_delay", 0.5)
         self.backoff_factor = getattr(settings, "ai_provider_retry_backoff_factor", 2.0)
         self._providers = providers or self._initialise_providers()
+        self._default_order = self._normalise_order(
+            getattr(settings, "ai_provider_order", list(PROVIDER_REGISTRY.keys()))
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -46,12 +50,15 @@ class AIProviderRouter:
     ) -> ProviderResponse:
         errors: List[ProviderErrorInfo] = []
         tried: List[str] = []
+        # Checked once per call so the per-attempt debug payload is only built when it will be emitted.
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         for provider in self._iter_providers(provider_order):
             tried.append(provider.name)
-            self.logger.debug(
-                "Attempting provider",
-                extra={"extra": {"provider": provider.name, "operation": "generate_text"}},
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "Attempting provider",
+                    extra={"extra": {"provider": provider.name, "operation": "generate_text"}},
+                )
             try:
                 return provider.generate_text(prompt=prompt, messages=messages, **kwargs)
             except ProviderNotConfiguredError as exc:
@@ -67,7 +74,7 @@ class AIProviderRouter:
                     extra={
                         "extra": {
                             "provider": provider.name,
-                            "error": exc.info.__dict__,
+                            "error": asdict(exc.info),
                             "operation": "generate_text",
                         }
                     },
@@ -98,14 +105,20 @@ class AIProviderRouter:
             providers[name] = provider
         return providers
 
-    def _iter_providers(self, override_order: Optional[Sequence[str]]) -> Iterable[BaseAIProvider]:
-        seen: set[str] = set()
-        order = override_order or getattr(self.settings, "ai_provider_order", list(PROVIDER_REGISTRY.keys()))
+    @staticmethod
+    def _normalise_order(order: Iterable[Optional[str]]) -> tuple[str, ...]:
+        keys: Dict[str, None] = {}
         for name in order:
             key = (name or "").lower().strip()
-            if not key or key in seen:
-                continue
-            seen.add(key)
+            if key:
+                keys.setdefault(key, None)
+        return tuple(keys)
+
+    def _iter_providers(self, override_order: Optional[Sequence[str]]) -> Iterable[BaseAIProvider]:
+        # The configured order is resolved once at construction; only per-call
+        # overrides need normalising here.
+        order = self._normalise_order(override_order) if override_order else self._default_order
+        for key in order:
             provider = self._providers.get(key)
             if provider is None:
                 self.logger.debug("Requested provider '%s' is not registered.", key)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import errno
 import hashlib
+import os
 import shutil
 import tempfile
 import uuid
@@ -16,6 +18,7 @@ from ..repositories.media_asset import MediaAssetRepository
 from ..utils.pathing import asset_relative_path, ensure_within_root, to_relative_path
 
 _CHUNK_SIZE = 1024 * 1024  # 1 MiB
+_SENDFILE_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB
 
 
 class StorageError(Exception):
@@ -76,6 +79,8 @@ class StorageService:
     def __init__(self, settings: Settings, repository: MediaAssetRepository) -> None:
         self._settings = settings
         self._repository = repository
+        # Resolved once per service and reused by every path check below.
+        self._storage_root = settings.storage_root.resolve()
 
     def ingest_media_asset(
         self,
@@ -90,44 +95,46 @@ class StorageService:
     ) -> MediaAsset:
         asset_id = str(uuid.uuid4())
         relative_path = asset_relative_path(project_id, asset_type, asset_id, filename)
-        destination_path = ensure_within_root(self._settings.storage_root, relative_path)
+        destination_path = ensure_within_root(self._storage_root, relative_path, resolved=True)
         destination_path.parent.mkdir(parents=True, exist_ok=True)
 
         checksum = hashlib.sha256()
         total_bytes = 0
-        temp_path: Optional[Path] = None
-
-        with tempfile.NamedTemporaryFile(dir=self._settings.storage_temp, delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            while True:
-                chunk = fileobj.read(_CHUNK_SIZE)
-                if not chunk:
-                    break
-                if isinstance(chunk, str):
-                    raise TypeError("File-like object must be opened in binary mode")
-                temp_file.write(chunk)
-                total_bytes += len(chunk)
-                checksum.update(chunk)
+        temp_fd, temp_name = tempfile.mkstemp(dir=self._settings.storage_temp)
+        temp_path = Path(temp_name)
 
         try:
+            try:
+                while True:
+                    chunk = fileobj.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if isinstance(chunk, str):
+                        raise TypeError("File-like object must be opened in binary mode")
+                    self._write_all(temp_fd, chunk)
+                    total_bytes += len(chunk)
+                    checksum.update(chunk)
+            finally:
+                os.close(temp_fd)
+
             digest = checksum.hexdigest()
             if expected_checksum and digest != expected_checksum.lower():
                 raise ChecksumMismatchError(expected=expected_checksum.lower(), actual=digest)
 
-            usage = self.report_space_usage()
-            if (
-                self._settings.storage_max_bytes is not None
-                and usage.used_bytes + total_bytes > self._settings.storage_max_bytes
-            ):
-                raise StorageQuotaExceeded(
-                    used_bytes=usage.used_bytes,
-                    attempted_bytes=total_bytes,
-                    max_bytes=self._settings.storage_max_bytes,
-                )
+            # Only walk the storage tree when there is a quota to enforce.
+            max_bytes = self._settings.storage_max_bytes
+            if max_bytes is not None:
+                used_bytes = self._calculate_used_bytes(self._settings.storage_root)
+                if used_bytes + total_bytes > max_bytes:
+                    raise StorageQuotaExceeded(
+                        used_bytes=used_bytes,
+                        attempted_bytes=total_bytes,
+                        max_bytes=max_bytes,
+                    )
 
-            shutil.move(str(temp_path), str(destination_path))
+            self._publish_file(temp_path, destination_path)
 
-            stored_relative = to_relative_path(self._settings.storage_root, destination_path)
+            stored_relative = to_relative_path(self._storage_root, destination_path, resolved=True)
             stored_filename = destination_path.name
 
             asset_data = {
@@ -144,12 +151,11 @@ class StorageService:
             return self._repository.create(asset_data)
 
         finally:
-            if temp_path and temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
 
     def generate_signed_path(self, asset_id: str, *, expires_in: int = 300) -> SignedPath:
         asset = self._get_asset(asset_id)
-        absolute_path = ensure_within_root(self._settings.storage_root, asset.file_path)
+        absolute_path = ensure_within_root(self._storage_root, asset.file_path, resolved=True)
         expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
         return SignedPath(
             path=str(absolute_path),
@@ -161,11 +167,11 @@ class StorageService:
 
     def resolve_asset_path(self, asset_id: str) -> Path:
         asset = self._get_asset(asset_id)
-        return ensure_within_root(self._settings.storage_root, asset.file_path)
+        return ensure_within_root(self._storage_root, asset.file_path, resolved=True)
 
     def delete_media_asset(self, asset_id: str) -> None:
         asset = self._get_asset(asset_id)
-        file_path = ensure_within_root(self._settings.storage_root, asset.file_path)
+        file_path = ensure_within_root(self._storage_root, asset.file_path, resolved=True)
 
         try:
             file_path.unlink()
@@ -195,15 +201,64 @@ class StorageService:
     @staticmethod
     def _calculate_used_bytes(root: Path) -> int:
         total = 0
-        if not root.exists():
-            return total
-        for entry in root.rglob("*"):
-            if entry.is_file():
-                total += entry.stat().st_size
+        # scandir exposes the entry type from the directory listing itself, so only
+        # regular files cost an extra stat() call.
+        pending = [os.fspath(root)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
         return total
 
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        # Chunks go straight to the descriptor; a raw write may be partial.
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    @staticmethod
+    def _publish_file(source: Path, destination: Path) -> None:
+        try:
+            os.replace(source, destination)
+            return
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+
+        # Temp and storage roots live on different filesystems; copy in kernel space
+        # where possible instead of pumping the file through Python buffers. The copy goes
+        # to a sibling of the destination and is renamed into place, so a failed copy never
+        # leaves a truncated file at the asset path.
+        partial = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.part")
+        try:
+            with source.open("rb") as src, partial.open("xb") as dst:
+                if hasattr(os, "sendfile"):
+                    offset = 0
+                    while True:
+                        sent = os.sendfile(dst.fileno(), src.fileno(), offset, _SENDFILE_CHUNK_SIZE)
+                        if sent == 0:
+                            break
+                        offset += sent
+                else:
+                    shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+            os.replace(partial, destination)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        finally:
+            source.unlink(missing_ok=True)
+
     def _prune_empty_directories(self, start: Path) -> None:
-        root = self._settings.storage_root.resolve()
+        root = self._storage_root
         current = start.resolve()
         while current != root and root in current.parents:
             try:
@@ -1,23 +1,101 @@
 from __future__ import annotations
 
-import json
+import os
 import re
 import shutil
 import subprocess
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Iterable, Iterator, Sequence
+
+try:  # orjson is optional; it parses large ffprobe frame dumps several times faster.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _json_loads
 
 from ...core.config import Settings
-from ...utils.ffmpeg import parse_ffmpeg_error, temporary_workspace
+from ...utils.ffmpeg import parse_ffmpeg_error, temporary_output
 from ...utils.pathing import normalise_component
 
-_SILENCE_START_RE = re.compile(r"silence_start:\s*(?P<start>-?\d+(?:\.\d+)?)")
-_SILENCE_END_RE = re.compile(
-    r"silence_end:\s*(?P<end>-?\d+(?:\.\d+)?)(?:\s*\|\s*silence_duration:\s*(?P<duration>-?\d+(?:\.\d+)?))?"
+_SILENCE_RE = re.compile(
+    r"silence_(?P<kind>start|end):\s*(?P<value>-?\d+(?:\.\d+)?)"
+    r"(?:\s*\|\s*silence_duration:\s*(?P<duration>-?\d+(?:\.\d+)?))?"
 )
 
 
+_METADATA_CACHE_SIZE = 128
+# Lines of streamed stderr kept for error reporting; parse_ffmpeg_error only looks near the end.
+_STDERR_TAIL_LINES = 64
+_SCENE_CACHE_SIZE = 32
+
+# Keyed by (path, st_mtime_ns, st_size[, threshold]). A rewritten file gets a new key, so
+# entries never go stale; the LRU bounds keep superseded ones from piling up.
+_metadata_cache: OrderedDict[tuple[str, int, int], "VideoMetadata"] = OrderedDict()
+_scene_cache: OrderedDict[tuple[str, int, int, float], tuple["SceneDetectionResult", ...]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _file_identity(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (os.fspath(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _cache_get(cache: OrderedDict[Any, Any], key: Any) -> Any:
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(cache: OrderedDict[Any, Any], key: Any, value: Any, limit: int) -> None:
+    with _cache_lock:
+        cache[key] = value
+        if len(cache) > limit:
+            cache.popitem(last=False)
+
+
+def _format_decimal(value: float, places: int) -> str:
+    """Render ``value`` for an ffmpeg argument without trailing zeros (``1.500`` -> ``1.5``)."""
+
+    return ("%.*f" % (places, value)).rstrip("0").rstrip(".")
+
+
+@lru_cache(maxsize=16)
+def _which(executable: str, search_path: str | None) -> str:
+    """Resolve ``executable`` once per PATH value; ``shutil.which`` stats every PATH entry."""
+
+    return shutil.which(executable, path=search_path) or executable
+
+
+@lru_cache(maxsize=256)
+def _parse_rate_text(value: str) -> float | None:
+    """Parse ffprobe rate strings such as ``30000/1001``; probes repeat a handful of values."""
+
+    if value in ("", "N/A"):
+        return None
+    if "/" in value:
+        numerator, denominator = value.split("/", 1)
+        try:
+            num = float(numerator)
+            den = float(denominator)
+        except ValueError:
+            return None
+        if den == 0:
+            return None
+        return num / den
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 class FFmpegCommandError(RuntimeError):
     """Raised when an FFmpeg or FFprobe command fails."""
 
@@ -35,7 +113,7 @@ class FFmpegCommandError(RuntimeError):
         super().__init__(message or parse_ffmpeg_error(self.stderr))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoMetadata:
     duration: float | None
     fps: float | None
@@ -44,13 +122,13 @@ class VideoMetadata:
     codec: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SceneDetectionResult:
     timestamp: float
     score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SilenceSegment:
     start: float
     end: float
@@ -68,15 +146,37 @@ class FFmpegService:
         ffprobe_path: str | None = None,
     ) -> None:
         self._settings = settings
-        self._ffmpeg = ffmpeg_path or shutil.which("ffmpeg") or "ffmpeg"
-        self._ffprobe = ffprobe_path or shutil.which("ffprobe") or "ffprobe"
+        search_path = os.environ.get("PATH")
+        self._ffmpeg = ffmpeg_path or _which("ffmpeg", search_path)
+        self._ffprobe = ffprobe_path or _which("ffprobe", search_path)
 
     # ------------------------------------------------------------------
     # Public API
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached probe and scene detection results for every file."""
+
+        with _cache_lock:
+            _metadata_cache.clear()
+            _scene_cache.clear()
+
     def get_video_metadata(self, input_path: Path) -> VideoMetadata:
+        identity = _file_identity(input_path)
+        if identity is not None:
+            cached = _cache_get(_metadata_cache, identity)
+            if cached is not None:
+                return cached
+
+        metadata = self._probe_video_metadata(input_path)
+        if identity is not None:
+            _cache_put(_metadata_cache, identity, metadata, _METADATA_CACHE_SIZE)
+        return metadata
+
+    def _probe_video_metadata(self, input_path: Path) -> VideoMetadata:
         command = self.build_probe_command(input_path)
-        result = self._run(command, capture_stdout=True, capture_stderr=True)
-        payload = json.loads(result.stdout or "{}")
+        # JSON output is parsed straight from the raw bytes; no decoded copy is kept.
+        result = self._run(command, capture_stdout=True, capture_stderr=True, text=False)
+        payload = _json_loads(result.stdout or b"{}")
 
         stream = next(
             (item for item in payload.get("streams", []) if item.get("codec_type") == "video"),
@@ -99,21 +199,46 @@ class FFmpegService:
         return VideoMetadata(duration=duration, fps=fps, width=width, height=height, codec=codec)
 
     def detect_scenes(self, input_path: Path, *, threshold: float = 0.4) -> list[SceneDetectionResult]:
+        # Scene detection decodes the whole file, so repeat runs on an unchanged file are served from cache.
+        identity = _file_identity(input_path)
+        cache_key = (*identity, threshold) if identity is not None else None
+        if cache_key is not None:
+            cached = _cache_get(_scene_cache, cache_key)
+            if cached is not None:
+                return list(cached)
+
+        detections = self._detect_scenes(input_path, threshold=threshold)
+        if cache_key is not None:
+            _cache_put(_scene_cache, cache_key, tuple(detections), _SCENE_CACHE_SIZE)
+        return detections
+
+    def _detect_scenes(self, input_path: Path, *, threshold: float) -> list[SceneDetectionResult]:
         command = self.build_scene_detection_command(input_path, threshold=threshold)
-        result = self._run(command, capture_stdout=True, capture_stderr=True)
-        payload = json.loads(result.stdout or "{}")
+        result = self._run(command, capture_stdout=True, capture_stderr=True, text=False)
+        payload = _json_loads(result.stdout or b"{}")
 
         detections: list[SceneDetectionResult] = []
+        append = detections.append
+        safe_float = self._safe_float
+        in_order = True
+        previous = float("-inf")
         for frame in payload.get("frames", []) or []:
-            score = self._safe_float(frame.get("tags", {}).get("lavfi.scene_score"))
+            tags = frame.get("tags")
+            score = safe_float(tags.get("lavfi.scene_score")) if tags else None
             if score is None:
                 continue
-            timestamp = self._safe_float(frame.get("pts_time"))
+            timestamp = safe_float(frame.get("pts_time"))
             if timestamp is None:
-                timestamp = self._safe_float(frame.get("pkt_pts_time"), default=0.0)
-            detections.append(SceneDetectionResult(timestamp=timestamp or 0.0, score=score))
-
-        detections.sort(key=lambda entry: entry.timestamp)
+                timestamp = safe_float(frame.get("pkt_pts_time"), default=0.0)
+            timestamp = timestamp or 0.0
+            if timestamp < previous:
+                in_order = False
+            previous = timestamp
+            append(SceneDetectionResult(timestamp=timestamp, score=score))
+
+        # ffprobe emits frames in presentation order, so the sort is normally a no-op.
+        if not in_order:
+            detections.sort(key=lambda entry: entry.timestamp)
         return detections
 
     def detect_silence(
@@ -128,8 +253,8 @@ class FFmpegService:
             noise_threshold=noise_threshold,
             min_duration=min_duration,
         )
-        result = self._run(command, capture_stdout=False, capture_stderr=True)
-        return self._parse_silence_output(result.stderr or "")
+        # silencedetect logs can run to megabytes on long inputs; parse them as they are written.
+        return self._segments_from_lines(self._iter_stderr_lines(command))
 
     def extract_audio_waveform(
         self,
@@ -142,8 +267,9 @@ class FFmpegService:
         output_name = f"{normalise_component(input_path.stem)}-waveform.png"
         final_path = self._settings.storage_temp / output_name
 
-        with temporary_workspace(self._settings.storage_temp, prefix="waveform-") as workspace:
-            temp_path = workspace / output_name
+        with temporary_output(
+            self._settings.storage_temp, prefix="waveform-", suffix=final_path.suffix
+        ) as temp_path:
             command = self.build_waveform_command(
                 input_path,
                 temp_path,
@@ -152,7 +278,7 @@ class FFmpegService:
                 color=color,
             )
             self._run(command, capture_stdout=False, capture_stderr=True)
-            shutil.move(str(temp_path), str(final_path))
+            os.replace(temp_path, final_path)
 
         return final_path
 
@@ -161,14 +287,22 @@ class FFmpegService:
         output_name = f"{normalise_component(input_path.stem)}-audio{suffix}"
         final_path = self._settings.storage_temp / output_name
 
-        with temporary_workspace(self._settings.storage_temp, prefix="audio-") as workspace:
-            temp_path = workspace / output_name
+        with temporary_output(
+            self._settings.storage_temp, prefix="audio-", suffix=final_path.suffix
+        ) as temp_path:
             command = self.build_audio_extract_command(input_path, temp_path, output_format=output_format)
             self._run(command, capture_stdout=False, capture_stderr=True)
-            shutil.move(str(temp_path), str(final_path))
+            os.replace(temp_path, final_path)
 
         return final_path
 
+    def extract_audio_pcm(self, input_path: Path, *, sample_rate: int = 44100) -> bytes:
+        """Decode the audio track to mono signed 16-bit little-endian PCM, piped straight into memory."""
+
+        command = self.build_audio_pcm_command(input_path, sample_rate=sample_rate)
+        result = self._run(command, capture_stdout=True, capture_stderr=True, text=False)
+        return result.stdout or b""
+
     def generate_thumbnail(
         self,
         input_path: Path,
@@ -179,11 +313,12 @@ class FFmpegService:
         output_name = f"{normalise_component(input_path.stem)}-thumbnail.jpg"
         final_path = self._settings.storage_temp / output_name
 
-        with temporary_workspace(self._settings.storage_temp, prefix="thumb-") as workspace:
-            temp_path = workspace / output_name
+        with temporary_output(
+            self._settings.storage_temp, prefix="thumb-", suffix=final_path.suffix
+        ) as temp_path:
             command = self.build_thumbnail_command(input_path, temp_path, timestamp=timestamp, width=width)
             self._run(command, capture_stdout=False, capture_stderr=True)
-            shutil.move(str(temp_path), str(final_path))
+            os.replace(temp_path, final_path)
 
         return final_path
 
@@ -196,8 +331,9 @@ class FFmpegService:
         output_name = f"{normalise_component(input_path.stem)}-normalized.mp4"
         final_path = self._settings.storage_temp / output_name
 
-        with temporary_workspace(self._settings.storage_temp, prefix="transcode-") as workspace:
-            temp_path = workspace / output_name
+        with temporary_output(
+            self._settings.storage_temp, prefix="transcode-", suffix=final_path.suffix
+        ) as temp_path:
             command = self.build_transcode_command(
                 input_path,
                 temp_path,
@@ -219,7 +355,7 @@ class FFmpegService:
                 else:
                     raise exc
 
-            shutil.move(str(temp_path), str(final_path))
+            os.replace(temp_path, final_path)
 
         return final_path
 
@@ -233,13 +369,16 @@ class FFmpegService:
             "error",
             "-print_format",
             "json",
-            "-show_streams",
-            "-show_format",
+            # Only the first video stream and the container duration are read back.
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=codec_type,codec_name,width,height,duration,avg_frame_rate,r_frame_rate:format=duration",
             str(input_path),
         ]
 
     def build_scene_detection_command(self, input_path: Path, *, threshold: float) -> list[str]:
-        safe_threshold = f"{threshold:.6f}".rstrip("0").rstrip(".")
+        safe_threshold = _format_decimal(threshold, 6)
         filter_expr = f"movie={input_path.as_posix()},select=gt(scene\\,{safe_threshold})"
         return [
             self._ffprobe,
@@ -273,10 +412,17 @@ class FFmpegService:
             "-hide_banner",
             "-loglevel",
             "info",
+            "-nostats",
+            "-threads",
+            str(self._settings.ffmpeg_analysis_threads),
             "-i",
             str(input_path),
+            # Audio only: skip video decoding and keep the null-muxer encode trivial.
+            "-vn",
             "-af",
             f"silencedetect=noise={noise_value}:d={min_duration}",
+            "-c:a",
+            "pcm_s32le",
             "-f",
             "null",
             "-",
@@ -328,10 +474,47 @@ class FFmpegService:
             command += ["-ac", "1", "-ar", "44100", "-c:a", "pcm_s16le", str(output_path)]
         elif normalised_format == "mp3":
             command += ["-ac", "2", "-ar", "44100", "-c:a", "libmp3lame", "-b:a", "192k", str(output_path)]
+        elif normalised_format in ("ogg", "opus"):
+            # Speech-tuned Opus: roughly a tenth of the bytes of 16-bit WAV for upload to transcription APIs.
+            command += [
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "libopus",
+                "-b:a",
+                "24k",
+                "-application",
+                "voip",
+                "-f",
+                "ogg",
+                str(output_path),
+            ]
         else:
             command += ["-ac", "2", str(output_path)]
         return command
 
+    def build_audio_pcm_command(self, input_path: Path, *, sample_rate: int = 44100) -> list[str]:
+        return [
+            self._ffmpeg,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            str(input_path),
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(sample_rate),
+            "-f",
+            "s16le",
+            "-c:a",
+            "pcm_s16le",
+            "pipe:1",
+        ]
+
     def build_thumbnail_command(
         self,
         input_path: Path,
@@ -340,7 +523,7 @@ class FFmpegService:
         timestamp: float,
         width: int,
     ) -> list[str]:
-        timestamp_value = f"{timestamp:.3f}".rstrip("0").rstrip(".")
+        timestamp_value = _format_decimal(timestamp, 3)
         return [
             self._ffmpeg,
             "-hide_banner",
@@ -413,23 +596,27 @@ class FFmpegService:
         *,
         capture_stdout: bool,
         capture_stderr: bool,
-    ) -> subprocess.CompletedProcess[str]:
+        text: bool = True,
+    ) -> subprocess.CompletedProcess[Any]:
         try:
             completed = subprocess.run(  # noqa: S603
                 command,
                 stdout=subprocess.PIPE if capture_stdout else None,
                 stderr=subprocess.PIPE if capture_stderr else None,
-                text=True,
-                encoding="utf-8",
+                text=text,
+                encoding="utf-8" if text else None,
                 check=False,
             )
         except FileNotFoundError as exc:  # pragma: no cover - defensive guard
             raise FFmpegCommandError(command, message=f"Executable not found: {command[0]}") from exc
 
         if completed.returncode != 0:
+            stderr = completed.stderr or ""
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", errors="replace")
             raise FFmpegCommandError(
                 command,
-                stderr=completed.stderr or "",
+                stderr=stderr,
                 returncode=completed.returncode,
             )
 
@@ -437,6 +624,8 @@ class FFmpegService:
 
     @staticmethod
     def _safe_float(value: object, *, default: float | None = None) -> float | None:
+        if type(value) is float:
+            return value
         if value is None:
             return default
         try:
@@ -446,6 +635,9 @@ class FFmpegService:
 
     @staticmethod
     def _safe_int(value: object, *, default: int | None = None) -> int | None:
+        # ffprobe emits most dimensions as JSON numbers; skip the conversion attempt for them.
+        if type(value) is int:
+            return value
         if value is None:
             return default
         try:
@@ -455,43 +647,70 @@ class FFmpegService:
 
     @staticmethod
     def _parse_fraction(value: object) -> float | None:
-        if value in (None, "", "N/A"):
-            return None
         if isinstance(value, (int, float)):
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return None
-        if isinstance(value, str) and "/" in value:
-            numerator, denominator = value.split("/", 1)
-            try:
-                num = float(numerator)
-                den = float(denominator)
-                if den == 0:
-                    return None
-                return num / den
-            except (TypeError, ValueError):
-                return None
+            return float(value)
+        if isinstance(value, str):
+            return _parse_rate_text(value)
+        if value is None:
+            return None
         try:
             return float(value)  # type: ignore[arg-type]
         except (TypeError, ValueError):
             return None
 
+    def _iter_stderr_lines(self, command: Sequence[str]) -> Iterator[str]:
+        """Run ``command`` and yield its stderr line by line while it executes."""
+
+        try:
+            process = subprocess.Popen(  # noqa: S603
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - defensive guard
+            raise FFmpegCommandError(command, message=f"Executable not found: {command[0]}") from exc
+
+        tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        try:
+            for line in process.stderr or ():
+                tail.append(line)
+                yield line
+            returncode = process.wait()
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            if process.stderr is not None:
+                process.stderr.close()
+
+        if returncode != 0:
+            raise FFmpegCommandError(command, stderr="".join(tail), returncode=returncode)
+
     @staticmethod
     def _parse_silence_output(stderr: str) -> list[SilenceSegment]:
+        return FFmpegService._segments_from_lines(stderr.splitlines())
+
+    @staticmethod
+    def _segments_from_lines(lines: Iterable[str]) -> list[SilenceSegment]:
         segments: list[SilenceSegment] = []
         current_start: float | None = None
 
-        for raw_line in stderr.splitlines():
-            line = raw_line.strip()
-            start_match = _SILENCE_START_RE.search(line)
-            if start_match:
-                current_start = float(start_match.group("start"))
+        for line in lines:
+            # Nearly all stderr lines are progress/stream noise; skip them before any regex work.
+            if "silence_" not in line:
+                continue
+            match = _SILENCE_RE.search(line)
+            if match is None:
+                continue
+            if match.group("kind") == "start":
+                current_start = float(match.group("value"))
                 continue
-            end_match = _SILENCE_END_RE.search(line)
-            if end_match and current_start is not None:
-                end_value = float(end_match.group("end"))
-                duration_value = end_match.group("duration")
+            if current_start is not None:
+                end_value = float(match.group("value"))
+                duration_value = match.group("duration")
                 duration = float(duration_value) if duration_value is not None else max(0.0, end_value - current_start)
                 segments.append(
                     SilenceSegment(
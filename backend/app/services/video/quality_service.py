@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import logging
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterator, List, Sequence
 
 import cv2
 import librosa
 import numpy as np
-import soundfile as sf
 
 from ...core.config import Settings
 from .ffmpeg_service import FFmpegService
 
+_AUDIO_SAMPLE_RATE = 44100
+# Only the mean loudness is used, so RMS frames need not overlap.
+_RMS_FRAME_LENGTH = 2048
+# Mean RMS below this (about -80 dBFS) is treated as a silent track.
+_SILENT_RMS = 1e-4
+# Samples closer together than this are reached by decoding forward rather than seeking.
+_MAX_GRAB_SECONDS = 2.0
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QualityMetrics:
     sharpness: float
     exposure: float
@@ -89,20 +96,21 @@ class QualityService:
             if metadata.duration is None or metadata.duration <= 0:
                 raise QualityAnalysisError("Video duration could not be determined")
 
-            sharpness = self._analyse_sharpness(video_path, metadata.duration, sample_count)
-            exposure = self._analyse_exposure(video_path, metadata.duration, sample_count)
-            motion_blur = self._analyse_motion_blur(video_path, metadata.duration, sample_count)
-            noise_level = self._analyse_noise(video_path, metadata.duration, sample_count)
-
-            audio_quality: float | None = None
-            try:
-                audio_quality = self._analyse_audio_quality(video_path)
-            except Exception as exc:
-                self._logger.warning(
-                    "Audio quality analysis failed, proceeding without audio metrics",
-                    exc_info=exc,
-                    extra={"extra": {"video_path": str(video_path)}},
-                )
+            timestamps = self._generate_sample_timestamps(metadata.duration, sample_count)
+            # Audio decoding runs in an ffmpeg subprocess, so it overlaps with the OpenCV frame pass.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                audio_future = executor.submit(self._analyse_audio_quality, video_path)
+                sharpness, exposure, motion_blur, noise_level = self._analyse_frames(video_path, timestamps)
+
+                audio_quality: float | None = None
+                try:
+                    audio_quality = audio_future.result()
+                except Exception as exc:
+                    self._logger.warning(
+                        "Audio quality analysis failed, proceeding without audio metrics",
+                        exc_info=exc,
+                        extra={"extra": {"video_path": str(video_path)}},
+                    )
 
             overall_score = self._compute_overall_score(
                 sharpness, exposure, motion_blur, noise_level, audio_quality
@@ -123,105 +131,65 @@ class QualityService:
             self._logger.exception("Unexpected error during quality analysis", exc_info=exc)
             raise QualityAnalysisError(f"Quality analysis failed: {exc}") from exc
 
-    def _analyse_sharpness(self, video_path: Path, duration: float, sample_count: int) -> float:
-        cap = cv2.VideoCapture(str(video_path))
-        try:
-            timestamps = self._generate_sample_timestamps(duration, sample_count)
-            sharpness_scores: List[float] = []
-
-            for timestamp in timestamps:
-                frame = self._extract_frame_at_timestamp(cap, timestamp, duration)
-                if frame is not None:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-                    normalized = min(1.0, laplacian_var / 1000.0)
-                    sharpness_scores.append(normalized)
+    def _analyse_frames(
+        self, video_path: Path, timestamps: Sequence[float]
+    ) -> tuple[float, float, float, float]:
+        """Score sharpness, exposure, motion blur and noise from one decode of each sampled frame."""
 
-            return float(np.mean(sharpness_scores)) if sharpness_scores else 0.0
-        finally:
-            cap.release()
-
-    def _analyse_exposure(self, video_path: Path, duration: float, sample_count: int) -> float:
         cap = cv2.VideoCapture(str(video_path))
         try:
-            timestamps = self._generate_sample_timestamps(duration, sample_count)
+            sharpness_scores: List[float] = []
             exposure_scores: List[float] = []
-
-            for timestamp in timestamps:
-                frame = self._extract_frame_at_timestamp(cap, timestamp, duration)
-                if frame is not None:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    mean_brightness = gray.mean()
-                    ideal_brightness = 128.0
-                    deviation = abs(mean_brightness - ideal_brightness) / ideal_brightness
-                    score = max(0.0, 1.0 - deviation)
-                    exposure_scores.append(score)
-
-            return float(np.mean(exposure_scores)) if exposure_scores else 0.0
-        finally:
-            cap.release()
-
-    def _analyse_motion_blur(self, video_path: Path, duration: float, sample_count: int) -> float:
-        cap = cv2.VideoCapture(str(video_path))
-        try:
-            timestamps = self._generate_sample_timestamps(duration, sample_count)
             motion_blur_scores: List[float] = []
-
-            for timestamp in timestamps:
-                frame = self._extract_frame_at_timestamp(cap, timestamp, duration)
-                if frame is not None:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-                    variance = laplacian.var()
-                    blur_score = 1.0 - min(1.0, variance / 500.0)
-                    motion_blur_scores.append(blur_score)
-
-            return float(np.mean(motion_blur_scores)) if motion_blur_scores else 0.0
-        finally:
-            cap.release()
-
-    def _analyse_noise(self, video_path: Path, duration: float, sample_count: int) -> float:
-        cap = cv2.VideoCapture(str(video_path))
-        try:
-            timestamps = self._generate_sample_timestamps(duration, sample_count)
             noise_scores: List[float] = []
-
-            for timestamp in timestamps:
-                frame = self._extract_frame_at_timestamp(cap, timestamp, duration)
-                if frame is not None:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    noise_estimate = self._estimate_noise_level(gray)
-                    normalized = 1.0 - min(1.0, noise_estimate / 50.0)
-                    noise_scores.append(normalized)
-
-            return float(np.mean(noise_scores)) if noise_scores else 0.0
+            ideal_brightness = 128.0
+
+            for frame in self._iter_sampled_frames(cap, timestamps):
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                # One Laplacian feeds both the sharpness and the motion blur score. The 3x3
+                # aperture on uint8 input stays within +/-1020, so int16 holds it exactly.
+                _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+                laplacian_var = float(laplacian_std[0, 0]) ** 2
+                sharpness_scores.append(min(1.0, laplacian_var / 1000.0))
+                motion_blur_scores.append(1.0 - min(1.0, laplacian_var / 500.0))
+
+                deviation = abs(gray.mean() - ideal_brightness) / ideal_brightness
+                exposure_scores.append(max(0.0, 1.0 - deviation))
+
+                noise_estimate = self._estimate_noise_level(gray)
+                noise_scores.append(1.0 - min(1.0, noise_estimate / 50.0))
+
+            return (
+                float(np.mean(sharpness_scores)) if sharpness_scores else 0.0,
+                float(np.mean(exposure_scores)) if exposure_scores else 0.0,
+                float(np.mean(motion_blur_scores)) if motion_blur_scores else 0.0,
+                float(np.mean(noise_scores)) if noise_scores else 0.0,
+            )
         finally:
             cap.release()
 
     def _analyse_audio_quality(self, video_path: Path) -> float:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-            temp_audio_path = Path(temp_audio.name)
-
-        try:
-            audio_path = self._ffmpeg.extract_audio_track(video_path, output_format="wav")
-            y, sr = librosa.load(str(audio_path), sr=None)
-
-            rms = librosa.feature.rms(y=y)[0]
-            mean_rms = float(np.mean(rms))
-            normalized_level = min(1.0, mean_rms * 10.0)
-
-            spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-            mean_centroid = float(np.mean(spectral_centroid))
-            clarity_score = min(1.0, mean_centroid / 3000.0)
-
-            audio_score = (normalized_level * 0.6 + clarity_score * 0.4)
-
-            audio_path.unlink(missing_ok=True)
-
-            return audio_score
-        except Exception:
-            temp_audio_path.unlink(missing_ok=True)
-            raise
+        sr = _AUDIO_SAMPLE_RATE
+        pcm = self._ffmpeg.extract_audio_pcm(video_path, sample_rate=sr)
+        # Same scaling librosa.load applies to 16-bit PCM.
+        y = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        if y.size == 0:
+            raise QualityAnalysisError("No audio samples decoded")
+
+        rms = librosa.feature.rms(
+            y=y, frame_length=_RMS_FRAME_LENGTH, hop_length=_RMS_FRAME_LENGTH
+        )[0]
+        mean_rms = float(np.mean(rms))
+        if mean_rms < _SILENT_RMS:
+            # Nothing audible to judge; skip the per-frame FFT behind the centroid.
+            return 0.0
+        normalized_level = min(1.0, mean_rms * 10.0)
+
+        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        mean_centroid = float(np.mean(spectral_centroid))
+        clarity_score = min(1.0, mean_centroid / 3000.0)
+
+        return normalized_level * 0.6 + clarity_score * 0.4
 
     def _estimate_noise_level(self, gray_frame: np.ndarray) -> float:
         h, w = gray_frame.shape
@@ -235,27 +203,33 @@ class QualityService:
             center_w - crop_w : center_w + crop_w,
         ]
 
-        sigma = np.std(center_region)
-        return float(sigma)
+        # Population standard deviation, like np.std, without a float64 copy of the crop.
+        _, stddev = cv2.meanStdDev(center_region)
+        return float(stddev[0, 0])
+
+    def _iter_sampled_frames(self, cap: cv2.VideoCapture, timestamps: Sequence[float]) -> Iterator[np.ndarray]:
+        """Yield the frame at each timestamp, walking forward with grab() when the next sample is close.
+
+        A seek makes the demuxer restart from the previous keyframe, so short gaps are cheaper to
+        cross by grabbing (decode without colour conversion) than by seeking.
+        """
 
-    def _extract_frame_at_timestamp(
-        self,
-        cap: cv2.VideoCapture,
-        timestamp: float,
-        duration: float,
-    ) -> np.ndarray | None:
         fps = cap.get(cv2.CAP_PROP_FPS)
         if fps <= 0:
             fps = 30.0
-
-        frame_number = int(timestamp * fps)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-
-        ret, frame = cap.read()
-        if not ret or frame is None:
-            return None
-
-        return frame
+        max_grab_gap = int(fps * _MAX_GRAB_SECONDS)
+        position = 0
+        for frame_number in sorted(int(timestamp * fps) for timestamp in timestamps):
+            gap = frame_number - position
+            if 0 <= gap <= max_grab_gap:
+                if not all(cap.grab() for _ in range(gap)):
+                    return
+            else:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = cap.read()
+            position = frame_number + 1
+            if ret and frame is not None:
+                yield frame
 
     def _generate_sample_timestamps(self, duration: float, sample_count: int) -> List[float]:
         if sample_count <= 0:
@@ -263,12 +237,8 @@ class QualityService:
         if sample_count == 1:
             return [duration / 2.0]
 
-        timestamps: List[float] = []
         step = duration / (sample_count + 1)
-        for i in range(1, sample_count + 1):
-            timestamps.append(step * i)
-
-        return timestamps
+        return [step * i for i in range(1, sample_count + 1)]
 
     def _compute_overall_score(
         self,
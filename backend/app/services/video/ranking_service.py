@@ -2,14 +2,43 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...models.clip import ClipVersion
 from ...repositories.clip import ClipVersionRepository
 from ..ai.analysis_service import SceneScore
 
+# Lower bounds of the Fair/Good/Excellent bands; np.digitize maps a score onto _RECOMMENDATIONS.
+_RECOMMENDATION_BOUNDS = np.array([0.4, 0.6, 0.8])
+_RECOMMENDATIONS = (
+    "Poor - Retake recommended",
+    "Fair - Consider improvements",
+    "Good - Minor improvements possible",
+    "Excellent - Ready for publication",
+)
+
+# (metric, default when absent, threshold, higher_is_worse, message) for retake suggestions.
+_ISSUE_CHECKS: tuple[tuple[str, float | None, float, bool, str], ...] = (
+    ("sharpness", 1.0, 0.5, False, "Low sharpness (score: {:.2f})"),
+    ("exposure", 1.0, 0.5, False, "Poor exposure (score: {:.2f})"),
+    ("motion_blur", 0.0, 0.5, True, "High motion blur (score: {:.2f})"),
+    ("noise_level", 1.0, 0.5, False, "High noise level (score: {:.2f})"),
+    ("audio_quality", None, 0.5, False, "Poor audio quality (score: {:.2f})"),
+)
+
+
+@lru_cache(maxsize=64)
+def _normalise_weights(quality: float, ai_score: float) -> tuple[float, float]:
+    components = [max(quality, 0.0), max(ai_score, 0.0)]
+    total = sum(components)
+    if total <= 0:
+        return (1.0, 0.0)
+    return tuple(component / total for component in components)
+
 
 @dataclass(frozen=True)
 class RankingWeights:
@@ -17,11 +46,8 @@ class RankingWeights:
     ai_score: float = 0.5
 
     def normalised(self) -> tuple[float, float]:
-        components = [max(self.quality, 0.0), max(self.ai_score, 0.0)]
-        total = sum(components)
-        if total <= 0:
-            return (1.0, 0.0)
-        return tuple(component / total for component in components)
+        # Weights are frozen, so the pair is computed once per distinct value and shared.
+        return _normalise_weights(self.quality, self.ai_score)
 
 
 class ClipRanking(BaseModel):
@@ -44,6 +70,14 @@ class RetakeSuggestion(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+@dataclass(frozen=True, slots=True)
+class _ScoredVersions:
+    metrics: List[Dict[str, Any]]
+    quality: np.ndarray
+    ai_scores: List[float | None]
+    combined: np.ndarray
+
+
 class RankingService:
     def __init__(
         self,
@@ -64,39 +98,10 @@ class RankingService:
         *,
         scene_scores: Optional[Dict[str, SceneScore]] = None,
     ) -> List[ClipRanking]:
-        rankings: List[ClipRanking] = []
-        quality_weight, ai_weight = self._weights.normalised()
-
-        for version in clip_versions:
-            quality_metrics = version.quality_metrics or {}
-            quality_score = quality_metrics.get("overall_score", 0.0)
-
-            ai_score: float | None = None
-            if scene_scores and version.clip.source_asset_id:
-                scene_id = self._get_scene_id_for_version(version)
-                if scene_id and scene_id in scene_scores:
-                    ai_score = scene_scores[scene_id].highlight_score
-
-            if ai_score is not None:
-                combined = quality_score * quality_weight + ai_score * ai_weight
-            else:
-                combined = quality_score
-
-            recommendation = self._generate_recommendation(quality_score, ai_score, combined)
-
-            rankings.append(
-                ClipRanking(
-                    clip_version_id=version.id,
-                    quality_score=quality_score,
-                    ai_score=ai_score,
-                    combined_score=combined,
-                    quality_metrics=quality_metrics,
-                    recommendation=recommendation,
-                )
-            )
-
-        rankings.sort(key=lambda r: r.combined_score, reverse=True)
-        return rankings
+        scored = self._score_versions(clip_versions, scene_scores)
+        # Stable, so equal scores keep their input order as list.sort(reverse=True) did.
+        order = np.argsort(-scored.combined, kind="stable")
+        return self._build_rankings(clip_versions, scored, order)
 
     def get_top_clips(
         self,
@@ -105,8 +110,8 @@ class RankingService:
         top_n: int = 5,
         scene_scores: Optional[Dict[str, SceneScore]] = None,
     ) -> List[ClipRanking]:
-        rankings = self.rank_clips(clip_versions, scene_scores=scene_scores)
-        return rankings[:top_n]
+        scored = self._score_versions(clip_versions, scene_scores)
+        return self._build_rankings(clip_versions, scored, self._top_order(scored.combined, top_n))
 
     def suggest_retakes(
         self,
@@ -115,73 +120,129 @@ class RankingService:
         quality_threshold: float | None = None,
     ) -> List[RetakeSuggestion]:
         threshold = quality_threshold if quality_threshold is not None else self._quality_threshold
-        suggestions: List[RetakeSuggestion] = []
-
-        for version in clip_versions:
-            quality_metrics = version.quality_metrics or {}
-            quality_score = quality_metrics.get("overall_score", 0.0)
-
-            if quality_score < threshold:
-                issues = self._identify_quality_issues(quality_metrics)
-                suggestions.append(
-                    RetakeSuggestion(
-                        clip_version_id=version.id,
-                        issues=issues,
-                        quality_score=quality_score,
-                        quality_metrics=quality_metrics,
-                    )
-                )
-
-        suggestions.sort(key=lambda s: s.quality_score)
-        return suggestions
-
-    def _generate_recommendation(
-        self,
-        quality_score: float,
-        ai_score: float | None,
-        combined_score: float,
-    ) -> str:
-        if combined_score >= 0.8:
-            return "Excellent - Ready for publication"
-        elif combined_score >= 0.6:
-            return "Good - Minor improvements possible"
-        elif combined_score >= 0.4:
-            return "Fair - Consider improvements"
-        else:
-            return "Poor - Retake recommended"
+        scored = self._score_versions(clip_versions, None)
+        return self._build_retakes(clip_versions, scored, threshold)
 
-    def _identify_quality_issues(self, quality_metrics: Dict[str, float | None]) -> List[str]:
-        issues: List[str] = []
-
-        sharpness = quality_metrics.get("sharpness", 1.0)
-        if sharpness is not None and sharpness < 0.5:
-            issues.append(f"Low sharpness (score: {sharpness:.2f})")
+    def analyse(
+        self,
+        clip_versions: Sequence[ClipVersion],
+        *,
+        top_n: int = 5,
+        scene_scores: Optional[Dict[str, SceneScore]] = None,
+        quality_threshold: float | None = None,
+    ) -> tuple[List[ClipRanking], List[RetakeSuggestion]]:
+        """Return ``get_top_clips`` and ``suggest_retakes`` results from a single scoring pass."""
 
-        exposure = quality_metrics.get("exposure", 1.0)
-        if exposure is not None and exposure < 0.5:
-            issues.append(f"Poor exposure (score: {exposure:.2f})")
+        threshold = quality_threshold if quality_threshold is not None else self._quality_threshold
+        scored = self._score_versions(clip_versions, scene_scores)
+        top = self._build_rankings(clip_versions, scored, self._top_order(scored.combined, top_n))
+        return top, self._build_retakes(clip_versions, scored, threshold)
+
+    @staticmethod
+    def _top_order(combined: np.ndarray, top_n: int) -> np.ndarray:
+        descending = -combined
+        if 0 < top_n < descending.size:
+            # Partition to the top_n-th score, keep everything at least that good (ties
+            # included, in input order) and stable-sort only those candidates.
+            cutoff = np.partition(descending, top_n - 1)[top_n - 1]
+            candidates = np.flatnonzero(descending <= cutoff)
+            return candidates[np.argsort(descending[candidates], kind="stable")][:top_n]
+        return np.argsort(descending, kind="stable")[:top_n]
+
+    def _build_retakes(
+        self,
+        clip_versions: Sequence[ClipVersion],
+        scored: _ScoredVersions,
+        threshold: float,
+    ) -> List[RetakeSuggestion]:
+        quality = scored.quality
+        below = np.flatnonzero(quality < threshold)
+        order = below[np.argsort(quality[below], kind="stable")]
+        return [
+            RetakeSuggestion.model_construct(
+                clip_version_id=clip_versions[index].id,
+                issues=self._identify_quality_issues(scored.metrics[index]),
+                quality_score=quality_score,
+                quality_metrics=scored.metrics[index],
+            )
+            for index, quality_score in zip(order.tolist(), quality[order].tolist())
+        ]
 
-        motion_blur = quality_metrics.get("motion_blur", 0.0)
-        if motion_blur is not None and motion_blur > 0.5:
-            issues.append(f"High motion blur (score: {motion_blur:.2f})")
+    def _score_versions(
+        self,
+        clip_versions: Sequence[ClipVersion],
+        scene_scores: Optional[Dict[str, SceneScore]],
+    ) -> _ScoredVersions:
+        """Gather quality and AI scores into parallel arrays and combine them in one vector pass."""
+
+        count = len(clip_versions)
+        # Results are built with model_construct, so hand each one its own copy rather than the
+        # ORM's JSON dict (validation used to make that copy).
+        metrics = [dict(version.quality_metrics or {}) for version in clip_versions]
+        quality = np.fromiter(
+            (quality_metrics.get("overall_score", 0.0) for quality_metrics in metrics),
+            dtype=np.float64,
+            count=count,
+        )
+
+        ai_scores: List[float | None] = [None] * count
+        if scene_scores:
+            self._repository.prefetch_ranking_fields(clip_versions)
+            lookup = scene_scores.get
+            for index, version in enumerate(clip_versions):
+                clip = version.clip
+                # Scene scores are keyed scene_<clip start in whole seconds>.
+                if clip.source_asset_id and clip.start_time is not None:
+                    scene = lookup(f"scene_{int(clip.start_time)}")
+                    if scene is not None:
+                        ai_scores[index] = scene.highlight_score
+
+        combined = quality
+        if any(score is not None for score in ai_scores):
+            quality_weight, ai_weight = self._weights.normalised()
+            ai_mask = np.fromiter((score is not None for score in ai_scores), dtype=bool, count=count)
+            ai = np.fromiter((score or 0.0 for score in ai_scores), dtype=np.float64, count=count)
+            combined = np.where(ai_mask, quality * quality_weight + ai * ai_weight, quality)
+
+        return _ScoredVersions(metrics=metrics, quality=quality, ai_scores=ai_scores, combined=combined)
+
+    def _build_rankings(
+        self,
+        clip_versions: Sequence[ClipVersion],
+        scored: _ScoredVersions,
+        indices: np.ndarray,
+    ) -> List[ClipRanking]:
+        combined = scored.combined[indices]
+        # digitize sorts NaN above every bound; the old if/elif chain fell through to "Poor".
+        bands = np.digitize(np.nan_to_num(combined, nan=0.0), _RECOMMENDATION_BOUNDS)
+        return [
+            ClipRanking.model_construct(
+                clip_version_id=clip_versions[index].id,
+                quality_score=quality_score,
+                ai_score=scored.ai_scores[index],
+                combined_score=combined_score,
+                quality_metrics=scored.metrics[index],
+                recommendation=_RECOMMENDATIONS[band],
+            )
+            for index, quality_score, combined_score, band in zip(
+                indices.tolist(), scored.quality[indices].tolist(), combined.tolist(), bands.tolist()
+            )
+        ]
 
-        noise_level = quality_metrics.get("noise_level", 1.0)
-        if noise_level is not None and noise_level < 0.5:
-            issues.append(f"High noise level (score: {noise_level:.2f})")
+    def _identify_quality_issues(self, quality_metrics: Dict[str, float | None]) -> List[str]:
+        issues: List[str] = []
 
-        audio_quality = quality_metrics.get("audio_quality")
-        if audio_quality is not None and audio_quality < 0.5:
-            issues.append(f"Poor audio quality (score: {audio_quality:.2f})")
+        for key, default, threshold, higher_is_worse, template in _ISSUE_CHECKS:
+            value = quality_metrics.get(key, default)
+            if value is None:
+                continue
+            if (value > threshold) if higher_is_worse else (value < threshold):
+                issues.append(template.format(value))
 
         if not issues:
             issues.append("Overall quality below threshold")
 
         return issues
 
-    def _get_scene_id_for_version(self, version: ClipVersion) -> str | None:
-        if version.clip.start_time is not None:
-            return f"scene_{int(version.clip.start_time)}"
-        return None
-
 
 __all__ = ["RankingService", "RankingWeights", "ClipRanking", "RetakeSuggestion"]
@@ -1,37 +1,89 @@
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import tempfile
+import uuid
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 _ERROR_LINE_RE = re.compile(r"(?P<level>error|fatal|warning)[:\s]+(?P<message>.+)", re.IGNORECASE)
+# Base directories already created by this process; every ffmpeg operation writes under one.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _create_in(base_dir: Path, make: Callable[[Path], T]) -> T:
+    if base_dir not in _ENSURED_DIRS:
+        base_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(base_dir)
+    try:
+        return make(base_dir)
+    except FileNotFoundError:
+        # The base directory was removed after it was first ensured.
+        base_dir.mkdir(parents=True, exist_ok=True)
+        return make(base_dir)
 
 
 @contextmanager
 def temporary_workspace(base_dir: Path, *, prefix: str = "ffmpeg-") -> Iterator[Path]:
     """Create a temporary working directory under the configured base path."""
 
-    base_dir.mkdir(parents=True, exist_ok=True)
-    workspace = Path(tempfile.mkdtemp(prefix=prefix, dir=base_dir))
+    workspace = _create_in(base_dir, lambda root: Path(tempfile.mkdtemp(prefix=prefix, dir=root)))
     try:
         yield workspace
     finally:
         shutil.rmtree(workspace, ignore_errors=True)
 
 
+def _reserve_file(root: Path, prefix: str, suffix: str) -> Path:
+    # Not mkstemp: its 0600 mode would carry over to the published output. Creating with
+    # 0666 lets the process umask decide, as for any other file ffmpeg writes.
+    while True:
+        path = root / f"{prefix}{uuid.uuid4().hex}{suffix}"
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return path
+
+
+@contextmanager
+def temporary_output(base_dir: Path, *, prefix: str = "ffmpeg-", suffix: str = "") -> Iterator[Path]:
+    """Reserve a unique output file under the base path, removed on exit unless moved away.
+
+    Cheaper than :func:`temporary_workspace` for single-output commands: no directory is
+    created or torn down per call. ``suffix`` should carry the extension ffmpeg uses to
+    pick the muxer.
+    """
+
+    path = _create_in(base_dir, lambda root: _reserve_file(root, prefix, suffix))
+    try:
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
+
+
 def parse_ffmpeg_error(stderr: str) -> str:
     """Extract a human friendly error message from FFmpeg stderr output."""
 
     if not stderr:
         return "Unknown FFmpeg error"
 
-    lines = [line.strip() for line in stderr.strip().splitlines() if line.strip()]
-    for line in reversed(lines):
+    # Walk backwards once; the relevant error is almost always near the end.
+    last_line: str | None = None
+    for raw_line in reversed(stderr.splitlines()):
+        line = raw_line.strip()
+        if not line:
+            continue
+        if last_line is None:
+            last_line = line
         match = _ERROR_LINE_RE.search(line)
         if match:
             return match.group("message").strip()
 
-    return lines[-1] if lines else "Unknown FFmpeg error"
+    return last_line or "Unknown FFmpeg error"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from ..models.enums import MediaAssetType
@@ -9,6 +10,7 @@ _COMPONENT_PATTERN = re.compile(r"[^a-z0-9_-]+")
 _ALLOWED_FILENAME_CHARS = set("abcdefghijklmnopqrstuvwxyz0123456789-_.")
 
 
+@lru_cache(maxsize=4096)
 def normalise_component(value: str) -> str:
     """Normalise a string so it is safe for use as a path component."""
 
@@ -45,10 +47,14 @@ def asset_relative_path(
     return asset_directory(project_id, asset_type, asset_id) / sanitise_filename(filename)
 
 
-def ensure_within_root(root: Path, relative_path: Path | str) -> Path:
-    """Resolve a relative path under the provided root, guarding against escapes."""
+def ensure_within_root(root: Path, relative_path: Path | str, *, resolved: bool = False) -> Path:
+    """Resolve a relative path under the provided root, guarding against escapes.
 
-    root = root.resolve()
+    Pass ``resolved=True`` when ``root`` has already been resolved by the caller.
+    """
+
+    if not resolved:
+        root = root.resolve()
     candidate = (root / Path(relative_path)).resolve()
     try:
         candidate.relative_to(root)
@@ -57,11 +63,12 @@ def ensure_within_root(root: Path, relative_path: Path | str) -> Path:
     return candidate
 
 
-def to_relative_path(root: Path, absolute_path: Path) -> Path:
+def to_relative_path(root: Path, absolute_path: Path, *, resolved: bool = False) -> Path:
     """Return a relative path beneath the root for the given absolute path."""
 
     absolute_path = absolute_path.resolve()
-    root = root.resolve()
+    if not resolved:
+        root = root.resolve()
     try:
         return absolute_path.relative_to(root)
     except ValueError as exc:  # pragma: no cover - defensive guard
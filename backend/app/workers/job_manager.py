@@ -74,12 +74,8 @@ class ProcessingJobLifecycle:
             cls.mark_failed(job_id, error_message)
             raise
 
-        cls.mark_queued(job_id, queue_name=queue, task_id=async_result.id)
-        job = cls.get_job(job_id)
-        if job is None:  # pragma: no cover - defensive programming
-            raise RuntimeError(f"Processing job {job_id} could not be retrieved after enqueueing.")
-
-        return job
+        # mark_queued hands back the refreshed row, so no second lookup is needed.
+        return cls.mark_queued(job_id, queue_name=queue, task_id=async_result.id)
 
     @classmethod
     def get_job(cls, job_id: str) -> Optional[ProcessingJob]:
@@ -122,22 +118,15 @@ class ProcessingJobLifecycle:
         message: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
     ) -> ProcessingJob:
-        updates: dict[str, Any] = {}
-        if progress is not None:
-            updates["progress"] = progress
-        if message is not None:
-            updates.setdefault("updates", [])
-        result_updates: dict[str, Any] = {}
-
-        if metadata:
-            result_updates.update(metadata)
+        result_updates: dict[str, Any] = dict(metadata) if metadata else {}
 
         if progress is not None:
             result_updates["progress"] = progress
 
         if message is not None:
-            result_updates.setdefault("log", [])
-            result_updates["log"].append({"timestamp": _now().isoformat(), "message": message})
+            entry = {"timestamp": _now().isoformat(), "message": message}
+            # Keep any log entries passed in metadata; the copy above leaves the caller's list alone.
+            result_updates["log"] = [*result_updates.get("log", []), entry]
 
         return cls._update_job(job_id, result_updates=result_updates)
 
@@ -14,6 +14,23 @@ from .job_manager import ProcessingJobLifecycle
 
 logger = logging.getLogger(__name__)
 
+# Demo processor fixtures; constant, so they are built once at import.
+_INGEST_STEPS = ("Validating video", "Extracting metadata", "Generating thumbnails")
+_TRANSCRIBE_STEPS = ("Extracting audio", "Sending to transcription service", "Processing results")
+_GENERATE_CLIP_STEPS = (
+    "Analyzing video content",
+    "Identifying key moments",
+    "Applying AI scoring",
+    "Generating clip suggestions",
+)
+_RENDER_PROGRESS = (0.1, 0.3, 0.5, 0.7, 0.9, 1.0)
+_EXPORT_STEPS = ("Preparing export", "Encoding video", "Finalizing")
+_DEMO_CLIPS = (
+    {"start": 10.0, "end": 25.0, "score": 0.95},
+    {"start": 45.0, "end": 60.0, "score": 0.88},
+    {"start": 90.0, "end": 105.0, "score": 0.82},
+)
+
 
 class ProcessingTask(Task):
     """Base task for processing jobs with standardized error handling."""
@@ -90,10 +107,10 @@ def _process_ingest(job_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     
     source_path = payload.get("source_path", "unknown")
     
-    for i, step in enumerate(["Validating video", "Extracting metadata", "Generating thumbnails"], start=1):
+    for i, step in enumerate(_INGEST_STEPS, start=1):
         ProcessingJobLifecycle.mark_progress(
             job_id,
-            progress=i / 3,
+            progress=i / len(_INGEST_STEPS),
             message=f"{step}...",
         )
         time.sleep(1)
@@ -114,10 +131,10 @@ def _process_transcribe(job_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     
     media_asset_id = payload.get("media_asset_id", "unknown")
     
-    for i, step in enumerate(["Extracting audio", "Sending to transcription service", "Processing results"], start=1):
+    for i, step in enumerate(_TRANSCRIBE_STEPS, start=1):
         ProcessingJobLifecycle.mark_progress(
             job_id,
-            progress=i / 3,
+            progress=i / len(_TRANSCRIBE_STEPS),
             message=f"{step}...",
         )
         time.sleep(1)
@@ -136,29 +153,18 @@ def _process_generate_clip(job_id: str, payload: dict[str, Any]) -> dict[str, An
     
     source_id = payload.get("source_id", "unknown")
     
-    steps = [
-        "Analyzing video content",
-        "Identifying key moments",
-        "Applying AI scoring",
-        "Generating clip suggestions",
-    ]
-    
-    for i, step in enumerate(steps, start=1):
+    for i, step in enumerate(_GENERATE_CLIP_STEPS, start=1):
         ProcessingJobLifecycle.mark_progress(
             job_id,
-            progress=i / len(steps),
+            progress=i / len(_GENERATE_CLIP_STEPS),
             message=f"{step}...",
         )
         time.sleep(1)
     
     return {
         "source_id": source_id,
-        "clips_generated": 3,
-        "clips": [
-            {"start": 10.0, "end": 25.0, "score": 0.95},
-            {"start": 45.0, "end": 60.0, "score": 0.88},
-            {"start": 90.0, "end": 105.0, "score": 0.82},
-        ],
+        "clips_generated": len(_DEMO_CLIPS),
+        "clips": [dict(clip) for clip in _DEMO_CLIPS],
     }
 
 
@@ -168,7 +174,7 @@ def _process_render(job_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     
     clip_version_id = payload.get("clip_version_id", "unknown")
     
-    for progress in [0.1, 0.3, 0.5, 0.7, 0.9, 1.0]:
+    for progress in _RENDER_PROGRESS:
         ProcessingJobLifecycle.mark_progress(
             job_id,
             progress=progress,
@@ -191,10 +197,10 @@ def _process_export(job_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     clip_id = payload.get("clip_id", "unknown")
     export_format = payload.get("format", "mp4")
     
-    for i, step in enumerate(["Preparing export", "Encoding video", "Finalizing"], start=1):
+    for i, step in enumerate(_EXPORT_STEPS, start=1):
         ProcessingJobLifecycle.mark_progress(
             job_id,
-            progress=i / 3,
+            progress=i / len(_EXPORT_STEPS),
             message=f"{step}...",
         )
         time.sleep(1)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
 from backend.app.core.config import TestingSettings
@@ -118,8 +120,42 @@ def test_router_returns_structured_errors_when_all_fail() -> None:
     assert {error.provider for error in exc.value.errors} == {"primary", "tertiary"}
 
 
+def test_provider_inputs_are_cloned_without_retries() -> None:
+    class MutatingProvider(_BaseTestProvider):
+        name = "mutating"
+
+        def _generate_text_impl(self, messages, call_options):  # type: ignore[override]
+            messages[0]["content"] = "changed"
+            call_options["metadata"]["seen"] = True
+            return ProviderResponse(provider=self.name, content="ok")
+
+    provider = MutatingProvider(TestingSettings())
+    messages = [{"role": "user", "content": "hello"}]
+    metadata: dict[str, bool] = {}
+
+    provider.generate_text(messages=messages, metadata=metadata)
+
+    assert messages == [{"role": "user", "content": "hello"}]
+    assert metadata == {}
+
+
 def test_openai_provider_disabled_without_api_key() -> None:
     settings = TestingSettings(openai_api_key=None)
     provider = OpenAIProvider(settings, timeout=0, max_retries=0, backoff_base=0, backoff_factor=1)
 
     assert provider.is_enabled is False
+
+
+def test_openai_rate_limit_backoff_honours_retry_after() -> None:
+    settings = TestingSettings(openai_api_key=None)
+    provider = OpenAIProvider(settings, timeout=30, max_retries=1, backoff_base=0.1, backoff_factor=2)
+    throttled = Exception("Rate limit reached")
+    throttled.status_code = 429  # type: ignore[attr-defined]
+    throttled.response = SimpleNamespace(headers={"retry-after": "3"})  # type: ignore[attr-defined]
+
+    error = provider._translate_exception(throttled)
+
+    assert error.info.retryable is True
+    assert error.info.extra["retry_after"] == 3.0
+    assert provider._compute_backoff(0, retry_after=error.info.extra["retry_after"]) == 3.0
+    assert 0.05 <= provider._compute_backoff(0) <= 0.15
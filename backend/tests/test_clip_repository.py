@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.app.models.base import Base
@@ -174,3 +174,79 @@ def test_update_quality_metrics_overwrites_existing(
 
     assert updated.quality_metrics["overall_score"] == 0.9
     assert updated.quality_metrics["sharpness"] == 0.9
+
+
+def test_update_quality_metrics_many_commits_once(
+    repository: ClipVersionRepository,
+    db_session: Session,
+    sample_clip: Clip,
+) -> None:
+    versions = [
+        ClipVersion(id=f"version-{index}", clip_id=sample_clip.id, version_number=index, status=ClipVersionStatus.DRAFT)
+        for index in range(1, 4)
+    ]
+    db_session.add_all(versions)
+    db_session.commit()
+    commits: list[None] = []
+    event.listen(db_session, "after_commit", lambda _session: commits.append(None))
+
+    count = repository.update_quality_metrics_many(
+        (version, {"overall_score": 0.1 * index}) for index, version in enumerate(versions, start=1)
+    )
+
+    assert count == 3
+    assert len(commits) == 1
+    db_session.expire_all()
+    stored = repository.get_many(version.id for version in versions)
+    assert stored["version-3"].quality_metrics == {"overall_score": pytest.approx(0.3)}
+
+
+def test_get_many_returns_versions_keyed_by_id(
+    repository: ClipVersionRepository,
+    db_session: Session,
+    sample_clip: Clip,
+) -> None:
+    for i in range(3):
+        db_session.add(
+            ClipVersion(
+                id=f"version-many-{i}",
+                clip_id=sample_clip.id,
+                version_number=i + 1,
+                status=ClipVersionStatus.DRAFT,
+            )
+        )
+    db_session.commit()
+
+    found = repository.get_many(["version-many-0", "version-many-2", "missing"])
+
+    assert set(found) == {"version-many-0", "version-many-2"}
+    assert found["version-many-2"].version_number == 3
+    assert repository.get_many([]) == {}
+
+
+def test_prefetch_ranking_fields_loads_clips_in_one_query(
+    repository: ClipVersionRepository,
+    db_session: Session,
+    sample_project: Project,
+) -> None:
+    for i in range(3):
+        db_session.add(Clip(id=f"clip-rank-{i}", project_id=sample_project.id, title=f"Clip {i}", status=ClipStatus.DRAFT))
+        db_session.add(
+            ClipVersion(
+                id=f"version-rank-{i}",
+                clip_id=f"clip-rank-{i}",
+                version_number=1,
+                status=ClipVersionStatus.DRAFT,
+            )
+        )
+    db_session.commit()
+    versions = list(repository.get_many(f"version-rank-{i}" for i in range(3)).values())
+    statements: list[str] = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    repository.prefetch_ranking_fields(versions)
+    titles = {version.clip.title for version in versions}
+    repository.prefetch_ranking_fields(versions)
+
+    assert titles == {"Clip 0", "Clip 1", "Clip 2"}
+    assert len(statements) == 1
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Sequence
+
+import pytest
+
+from backend.app.core.config import TestingSettings
+from backend.app.services.video.ffmpeg_service import FFmpegService
+
+# Command building and caching only; _run is stubbed where needed, so no ffmpeg binaries are required.
+
+
+@pytest.fixture()
+def ffmpeg_env(tmp_path: Path) -> tuple[FFmpegService, TestingSettings]:
+    settings = TestingSettings(storage_temp=str(tmp_path))
+    return FFmpegService(settings), settings
+
+
+def test_metadata_cached_until_file_changes(
+    ffmpeg_env: tuple[FFmpegService, TestingSettings], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _settings = ffmpeg_env
+    media_path = tmp_path / "clip.mp4"
+    media_path.write_bytes(b"first")
+    probes: list[list[str]] = []
+
+    def fake_run(
+        self: FFmpegService,
+        command: Sequence[str],
+        *,
+        capture_stdout: bool,
+        capture_stderr: bool,
+        text: bool = True,
+    ) -> subprocess.CompletedProcess[bytes]:
+        probes.append(list(command))
+        payload = {"streams": [{"codec_type": "video", "width": 640, "height": 360, "avg_frame_rate": "25/1"}]}
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(payload).encode(), stderr=b"")
+
+    monkeypatch.setattr(FFmpegService, "_run", fake_run, raising=True)
+
+    first = service.get_video_metadata(media_path)
+    assert service.get_video_metadata(media_path) is first
+    assert len(probes) == 1
+
+    media_path.write_bytes(b"second version")
+    assert service.get_video_metadata(media_path).width == 640
+    assert len(probes) == 2
+
+    FFmpegService.clear_cache()
+    service.get_video_metadata(media_path)
+    assert len(probes) == 3
+
+
+def test_scene_detection_cached_per_threshold(
+    ffmpeg_env: tuple[FFmpegService, TestingSettings], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _settings = ffmpeg_env
+    media_path = tmp_path / "scenes.mp4"
+    media_path.write_bytes(b"frames")
+    runs: list[list[str]] = []
+
+    def fake_run(
+        self: FFmpegService,
+        command: Sequence[str],
+        *,
+        capture_stdout: bool,
+        capture_stderr: bool,
+        text: bool = True,
+    ) -> subprocess.CompletedProcess[bytes]:
+        runs.append(list(command))
+        payload = {"frames": [{"pts_time": "1.5", "tags": {"lavfi.scene_score": "0.8"}}]}
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(payload).encode(), stderr=b"")
+
+    monkeypatch.setattr(FFmpegService, "_run", fake_run, raising=True)
+
+    first = service.detect_scenes(media_path, threshold=0.3)
+    first.clear()
+    assert [scene.timestamp for scene in service.detect_scenes(media_path, threshold=0.3)] == [1.5]
+    assert len(runs) == 1
+
+    service.detect_scenes(media_path, threshold=0.5)
+    assert len(runs) == 2
+
+
+def test_audio_extract_command_uses_opus_for_ogg(tmp_path: Path) -> None:
+    service = FFmpegService(TestingSettings(storage_temp=str(tmp_path)))
+
+    command = service.build_audio_extract_command(tmp_path / "in.mp4", tmp_path / "out.ogg", output_format="ogg")
+
+    assert command[command.index("-c:a") + 1] == "libopus"
+    assert command[command.index("-f") + 1] == "ogg"
+    assert command[-1] == str(tmp_path / "out.ogg")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+from backend.app.utils.ffmpeg import temporary_output
+
+
+def test_temporary_output_uses_umask_permissions(tmp_path: Path) -> None:
+    previous = os.umask(0o022)
+    try:
+        with temporary_output(tmp_path, prefix="thumb-", suffix=".jpg") as path:
+            assert path.name.startswith("thumb-") and path.suffix == ".jpg"
+            assert stat.S_IMODE(path.stat().st_mode) == 0o644
+            published = tmp_path / "published.jpg"
+            os.replace(path, published)
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(published.stat().st_mode) == 0o644
+    assert not path.exists()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from backend.app.workers.job_manager import ProcessingJobLifecycle
+
+
+def test_mark_progress_appends_message_to_metadata_log(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_update_job(cls, job_id: str, **kwargs: Any) -> None:
+        captured.update(kwargs)
+
+    monkeypatch.setattr(ProcessingJobLifecycle, "_update_job", classmethod(fake_update_job))
+    caller_log = [{"timestamp": "2024-01-01T00:00:00", "message": "queued"}]
+    metadata = {"stage": "render", "log": caller_log}
+
+    ProcessingJobLifecycle.mark_progress("job-1", progress=0.5, message="rendering", metadata=metadata)
+
+    result_updates = captured["result_updates"]
+    assert [entry["message"] for entry in result_updates["log"]] == ["queued", "rendering"]
+    assert result_updates["stage"] == "render"
+    assert result_updates["progress"] == 0.5
+    assert caller_log == [{"timestamp": "2024-01-01T00:00:00", "message": "queued"}]
+    assert metadata["log"] is caller_log
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -8,7 +9,12 @@ from backend.app.models.clip import Clip, ClipVersion
 from backend.app.models.enums import ClipStatus, ClipVersionStatus
 from backend.app.repositories.clip import ClipVersionRepository
 from backend.app.services.ai.analysis_service import SceneScore
-from backend.app.services.video.ranking_service import RankingService, RankingWeights
+from backend.app.services.video.ranking_service import (
+    ClipRanking,
+    RankingService,
+    RankingWeights,
+    RetakeSuggestion,
+)
 
 
 @pytest.fixture()
@@ -102,6 +108,33 @@ def test_get_top_clips_returns_limited_results(
     assert top_3[1].combined_score >= top_3[2].combined_score
 
 
+def test_get_top_clips_matches_full_ranking_with_ties(
+    mock_repository: ClipVersionRepository,
+    sample_clip_versions: list[ClipVersion],
+) -> None:
+    for index, version in enumerate(sample_clip_versions):
+        version.quality_metrics = {"overall_score": 0.5 if index % 2 else 0.7}
+    service = RankingService(mock_repository)
+
+    full = [ranking.clip_version_id for ranking in service.rank_clips(sample_clip_versions)]
+    top_3 = [ranking.clip_version_id for ranking in service.get_top_clips(sample_clip_versions, top_n=3)]
+
+    assert top_3 == full[:3] == ["version-0", "version-2", "version-4"]
+
+
+def test_analyse_matches_separate_calls(
+    mock_repository: ClipVersionRepository,
+    sample_clip_versions: list[ClipVersion],
+    sample_scene_scores: dict[str, SceneScore],
+) -> None:
+    service = RankingService(mock_repository, quality_threshold=0.6)
+
+    top, retakes = service.analyse(sample_clip_versions, top_n=2, scene_scores=sample_scene_scores)
+
+    assert top == service.get_top_clips(sample_clip_versions, top_n=2, scene_scores=sample_scene_scores)
+    assert retakes == service.suggest_retakes(sample_clip_versions)
+
+
 def test_suggest_retakes_identifies_low_quality_clips(
     mock_repository: ClipVersionRepository,
     sample_clip_versions: list[ClipVersion],
@@ -135,6 +168,13 @@ def test_ranking_weights_normalization() -> None:
     assert sum(normalized) == pytest.approx(1.0)
 
 
+def test_ranking_weights_serialise_only_configured_fields() -> None:
+    weights = RankingWeights(quality=3.0, ai_score=1.0)
+
+    assert asdict(weights) == {"quality": 3.0, "ai_score": 1.0}
+    assert weights.normalised() is RankingWeights(quality=3.0, ai_score=1.0).normalised()
+
+
 def test_zero_weights_defaults_to_quality_only() -> None:
     weights = RankingWeights(quality=0.0, ai_score=0.0)
     normalized = weights.normalised()
@@ -190,6 +230,7 @@ def test_retake_suggestions_identify_specific_issues(
 
     assert len(suggestions) == 1
     assert len(suggestions[0].issues) >= 4
+    assert RetakeSuggestion.model_validate(suggestions[0].model_dump()) == suggestions[0]
 
 
 def test_ranking_preserves_quality_metrics(
@@ -198,11 +239,15 @@ def test_ranking_preserves_quality_metrics(
 ) -> None:
     service = RankingService(mock_repository)
     rankings = service.rank_clips(sample_clip_versions)
+    originals = {version.id: version.quality_metrics for version in sample_clip_versions}
 
     for ranking in rankings:
         assert ranking.quality_metrics is not None
         assert "overall_score" in ranking.quality_metrics
         assert "sharpness" in ranking.quality_metrics
+        assert ranking.quality_metrics is not originals[ranking.clip_version_id]
+        # Rankings skip validation; they must still be exactly what validation would produce.
+        assert ClipRanking.model_validate(ranking.model_dump()) == ranking
 
 
 def test_ranking_handles_missing_quality_metrics(
@@ -229,3 +274,15 @@ def test_ranking_handles_missing_quality_metrics(
 
     assert len(rankings) == 1
     assert rankings[0].quality_score == 0.0
+
+
+def test_nan_quality_score_is_recommended_for_retake(
+    mock_repository: ClipVersionRepository,
+    sample_clip_versions: list[ClipVersion],
+) -> None:
+    sample_clip_versions[0].quality_metrics = {"overall_score": float("nan")}
+    service = RankingService(mock_repository)
+
+    rankings = {ranking.clip_version_id: ranking for ranking in service.rank_clips(sample_clip_versions)}
+
+    assert rankings["version-0"].recommendation == "Poor - Retake recommended"
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import errno
 import hashlib
 import io
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.app.core.config import TestingSettings
@@ -136,6 +138,61 @@ def test_ingest_with_incorrect_checksum(tmp_path: Path, db_session: Session) ->
         )
 
 
+def test_ingest_copies_across_filesystems(
+    tmp_path: Path, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, settings = _make_service(tmp_path, db_session)
+    real_replace = os.replace
+
+    def cross_device_replace(src: os.PathLike[str], dst: os.PathLike[str]) -> None:
+        # Only the move out of the temp directory crosses filesystems.
+        if Path(src).parent == settings.storage_temp:
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", cross_device_replace)
+    file_bytes = b"cross-device-contents" * 1024
+    asset = service.ingest_media_asset(
+        project_id="proj-123",
+        asset_type=MediaAssetType.SOURCE,
+        fileobj=io.BytesIO(file_bytes),
+        filename="clip.mp4",
+    )
+
+    stored_path = service.resolve_asset_path(asset.id)
+    assert stored_path.read_bytes() == file_bytes
+    assert [path.name for path in stored_path.parent.iterdir()] == [stored_path.name]
+    assert not any(settings.storage_temp.iterdir())
+
+
+def test_failed_cross_filesystem_copy_leaves_no_partial_file(
+    tmp_path: Path, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, settings = _make_service(tmp_path, db_session)
+
+    def cross_device_replace(src: object, dst: object) -> None:
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    def disk_full(*args: object) -> int:
+        raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+    monkeypatch.setattr(os, "replace", cross_device_replace)
+    monkeypatch.setattr(os, "sendfile", disk_full, raising=False)
+    monkeypatch.setattr("shutil.copyfileobj", disk_full)
+
+    with pytest.raises(OSError) as excinfo:
+        service.ingest_media_asset(
+            project_id="proj-123",
+            asset_type=MediaAssetType.SOURCE,
+            fileobj=io.BytesIO(b"data"),
+            filename="clip.mp4",
+        )
+
+    assert excinfo.value.errno == errno.ENOSPC
+    assert not any(path.is_file() for path in settings.storage_root.rglob("*"))
+    assert not any(settings.storage_temp.iterdir())
+
+
 def test_quota_enforced(tmp_path: Path, db_session: Session) -> None:
     service, settings = _make_service(tmp_path, db_session, storage_max_bytes=4)
 
@@ -150,6 +207,49 @@ def test_quota_enforced(tmp_path: Path, db_session: Session) -> None:
     assert not any(settings.storage_root.rglob("*"))
 
 
+def test_ingest_without_quota_skips_usage_walk(
+    tmp_path: Path, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _settings = _make_service(tmp_path, db_session)
+
+    def fail_walk(root: Path) -> int:
+        raise AssertionError("usage should not be computed without a quota")
+
+    monkeypatch.setattr(StorageService, "_calculate_used_bytes", staticmethod(fail_walk))
+
+    asset = service.ingest_media_asset(
+        project_id="proj-123",
+        asset_type=MediaAssetType.SOURCE,
+        fileobj=io.BytesIO(b"data"),
+        filename="clip.mp4",
+    )
+
+    assert asset.size_bytes == 4
+
+
+def test_storage_root_symlink_retarget_is_followed(tmp_path: Path, db_session: Session) -> None:
+    first_target = tmp_path / "disk-a"
+    second_target = tmp_path / "disk-b"
+    first_target.mkdir()
+    second_target.mkdir()
+    link = tmp_path / "storage-link"
+    link.symlink_to(first_target, target_is_directory=True)
+    settings = TestingSettings(storage_root=str(link), storage_temp=str(tmp_path / "temp"))
+    repository = MediaAssetRepository(db_session)
+    assert StorageService(settings, repository)._storage_root == first_target.resolve()
+
+    link.unlink()
+    link.symlink_to(second_target, target_is_directory=True)
+    asset = StorageService(settings, repository).ingest_media_asset(
+        project_id="proj-123",
+        asset_type=MediaAssetType.SOURCE,
+        fileobj=io.BytesIO(b"data"),
+        filename="clip.mp4",
+    )
+
+    assert (second_target / asset.file_path).read_bytes() == b"data"
+
+
 def test_repository_update_metadata(tmp_path: Path, db_session: Session) -> None:
     service, _settings = _make_service(tmp_path, db_session)
     asset = service.ingest_media_asset(
@@ -164,3 +264,22 @@ def test_repository_update_metadata(tmp_path: Path, db_session: Session) -> None
 
     assert updated.size_bytes == 123
     assert pytest.approx(updated.duration_seconds or 0, rel=1e-6) == 4.5
+
+
+def test_repository_update_metadata_skips_unchanged_values(tmp_path: Path, db_session: Session) -> None:
+    service, _settings = _make_service(tmp_path, db_session)
+    asset = service.ingest_media_asset(
+        project_id="proj-123",
+        asset_type=MediaAssetType.SOURCE,
+        fileobj=io.BytesIO(b"data"),
+        filename="clip.mp4",
+    )
+    repository = MediaAssetRepository(db_session)
+    commits: list[None] = []
+    event.listen(db_session, "after_commit", lambda _session: commits.append(None))
+
+    repository.update_metadata(asset, size_bytes=asset.size_bytes, checksum=asset.checksum)
+    assert commits == []
+
+    repository.update_metadata(asset, size_bytes=(asset.size_bytes or 0) + 1)
+    assert len(commits) == 1